@@ -82,8 +82,11 @@ def filter_by_radius(
     Keep only listings within radius_miles of (home_lat, home_lon).
     Listings with no coordinates always pass through — we never discard
     a job just because we couldn't geolocate it.
+
+    Same result as JobListing.is_within_radius per job; delegates to the
+    batch helper JobListing.filter_within_radius.
     """
-    return [j for j in listings if j.is_within_radius(home_lat, home_lon, radius_miles)]
+    return JobListing.filter_within_radius(listings, home_lat, home_lon, radius_miles)
 
 
 def filter_by_work_type(
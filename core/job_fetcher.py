@@ -159,14 +159,17 @@ def _deduplicate(listings: list) -> list:
     Remove duplicate listings using JobListing.dedup_key().
     When duplicates exist, keep the listing with the highest quality score.
     """
-    seen: dict = {}
+    seen: dict = {}  # dedup_key -> (listing, quality score)
     for listing in listings:
         key = listing.dedup_key()
-        if key not in seen:
-            seen[key] = listing
-        elif _quality_score(listing) > _quality_score(seen[key]):
-            seen[key] = listing
-    return list(seen.values())
+        kept = seen.get(key)
+        if kept is None:
+            seen[key] = (listing, None)
+            continue
+        kept_score = kept[1] if kept[1] is not None else _quality_score(kept[0])
+        score = _quality_score(listing)
+        seen[key] = (listing, score) if score > kept_score else (kept[0], kept_score)
+    return [listing for listing, _ in seen.values()]
 
 
 def _quality_score(listing) -> int:
@@ -12,16 +12,24 @@ import math
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Optional
 
+# Used by dedup_key — compiled once rather than per call
+_PUNCT_RE = re.compile(r"[^\w\s]")
+_SPACE_RE = re.compile(r"\s+")
 
-@dataclass
+
+@dataclass(slots=True)
 class JobListing:
     """
     Normalized representation of a single job listing.
 
     Required fields must be populated by every provider.
     Optional fields are filled in when available.
+
+    Slotted: searches hold hundreds of these at once, so there is no
+    per-instance __dict__. Attributes not declared below cannot be set.
     """
 
     # ── Required ──────────────────────────────────────────
@@ -59,7 +67,7 @@ class JobListing:
     distance_miles: Optional[float] = None  # Straight-line distance from user's home
 
     # ── Internal ──────────────────────────────────────────
-    raw: dict = field(default_factory=dict, repr=False)  # Original API response
+    raw: Optional[dict] = field(default=None, repr=False)  # Original API response, if kept
 
     def dedup_key(self) -> str:
         """
@@ -70,13 +78,7 @@ class JobListing:
         Normalizes by: lowercasing, stripping punctuation/extra spaces,
         and combining title + company + state.
         """
-        def _normalize(s: str) -> str:
-            s = s.lower().strip()
-            s = re.sub(r"[^\w\s]", "", s)   # remove punctuation
-            s = re.sub(r"\s+", " ", s)       # collapse whitespace
-            return s
-
-        return f"{_normalize(self.title)}|{_normalize(self.company)}|{_normalize(self.state)}"
+        return f"{_dedup_token(self.title)}|{_dedup_token(self.company)}|{_dedup_token(self.state)}"
 
     def is_within_radius(
         self,
@@ -94,6 +96,37 @@ class JobListing:
         distance = _haversine(home_lat, home_lon, self.latitude, self.longitude)
         return distance <= radius_miles
 
+    @staticmethod
+    def filter_within_radius(
+        listings: list["JobListing"],
+        home_lat: float,
+        home_lon: float,
+        radius_miles: float,
+    ) -> list["JobListing"]:
+        """
+        Batch form of is_within_radius: return the listings within
+        radius_miles of the given coordinates, in order. Listings with
+        unknown coordinates are kept. The home point's trig is computed
+        once for the whole batch instead of once per listing.
+        """
+        within = _radius_checker(home_lat, home_lon, radius_miles)
+        return [
+            j for j in listings
+            if j.latitude is None or j.longitude is None or within(j.latitude, j.longitude)
+        ]
+
+
+@lru_cache(maxsize=8192)
+def _dedup_token(s: str) -> str:
+    """
+    Normalize one dedup_key component. Cached because the same company
+    names and state codes repeat across nearly every result set.
+    """
+    s = s.lower().strip()
+    s = _PUNCT_RE.sub("", s)    # remove punctuation
+    s = _SPACE_RE.sub(" ", s)   # collapse whitespace
+    return s
+
 
 def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -101,8 +134,44 @@ def _haversine(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     Returns distance in miles.
     """
     R = 3958.8  # Earth radius in miles
-    lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+    # Convert only what the formula needs — no temporary list from map()
+    lat1 = math.radians(lat1)
+    lat2 = math.radians(lat2)
     dlat = lat2 - lat1
-    dlon = lon2 - lon1
+    dlon = math.radians(lon2 - lon1)
     a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
     return R * 2 * math.asin(math.sqrt(a))
+
+
+def _radius_checker(
+    home_lat: float,
+    home_lon: float,
+    radius_miles: float,
+) -> Callable[[float, float], bool]:
+    """
+    Build a (lat, lon) -> bool test for "within radius_miles of home",
+    for filtering many listings against one home point.
+
+    Equivalent to _haversine(...) <= radius_miles, but the home point is
+    converted once and the radius is turned into a bound on the haversine
+    term, so no asin/sqrt runs per listing.
+    """
+    if radius_miles < 0:
+        # No distance is negative, so nothing is within range
+        return lambda lat, lon: False
+
+    R = 3958.8  # Earth radius in miles
+    lat0 = math.radians(home_lat)
+    lon0 = math.radians(home_lon)
+    cos_lat0 = math.cos(lat0)
+    # Half the central angle, capped at pi/2 — any radius past the
+    # antipode covers the whole globe
+    a_max = math.sin(min(radius_miles / (2 * R), math.pi / 2)) ** 2
+    sin, cos, radians = math.sin, math.cos, math.radians
+
+    def _within(lat: float, lon: float) -> bool:
+        lat = radians(lat)
+        a = sin((lat - lat0) / 2) ** 2 + cos_lat0 * cos(lat) * sin((radians(lon) - lon0) / 2) ** 2
+        return a <= a_max
+
+    return _within
@@ -10,6 +10,7 @@ import logging.handlers
 import os
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -68,6 +69,7 @@ def haversine_distance(
     return R * 2 * math.asin(math.sqrt(a))
 
 
+@lru_cache(maxsize=2048)  # Pure; many listings share the same salary band
 def format_salary(
     salary_min: Optional[float],
     salary_max: Optional[float],
@@ -138,38 +140,45 @@ def days_ago(dt: datetime) -> str:
     return f"{days // 30} months ago"
 
 
+# Full state name -> two-letter code, and the set of valid codes
+_STATES = {
+    "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR",
+    "california": "CA", "colorado": "CO", "connecticut": "CT", "delaware": "DE",
+    "florida": "FL", "georgia": "GA", "hawaii": "HI", "idaho": "ID",
+    "illinois": "IL", "indiana": "IN", "iowa": "IA", "kansas": "KS",
+    "kentucky": "KY", "louisiana": "LA", "maine": "ME", "maryland": "MD",
+    "massachusetts": "MA", "michigan": "MI", "minnesota": "MN", "mississippi": "MS",
+    "missouri": "MO", "montana": "MT", "nebraska": "NE", "nevada": "NV",
+    "new hampshire": "NH", "new jersey": "NJ", "new mexico": "NM", "new york": "NY",
+    "north carolina": "NC", "north dakota": "ND", "ohio": "OH", "oklahoma": "OK",
+    "oregon": "OR", "pennsylvania": "PA", "rhode island": "RI", "south carolina": "SC",
+    "south dakota": "SD", "tennessee": "TN", "texas": "TX", "utah": "UT",
+    "vermont": "VT", "virginia": "VA", "washington": "WA", "west virginia": "WV",
+    "wisconsin": "WI", "wyoming": "WY", "district of columbia": "DC",
+}
+_STATE_CODES = frozenset(_STATES.values())
+
+
 def normalize_state(state_input: str) -> str:
     """
     Normalize a US state to its two-letter abbreviation.
     Accepts full names ("Texas") or abbreviations ("tx" -> "TX").
     Returns empty string if not recognized.
     """
-    _STATES = {
-        "alabama": "AL", "alaska": "AK", "arizona": "AZ", "arkansas": "AR",
-        "california": "CA", "colorado": "CO", "connecticut": "CT", "delaware": "DE",
-        "florida": "FL", "georgia": "GA", "hawaii": "HI", "idaho": "ID",
-        "illinois": "IL", "indiana": "IN", "iowa": "IA", "kansas": "KS",
-        "kentucky": "KY", "louisiana": "LA", "maine": "ME", "maryland": "MD",
-        "massachusetts": "MA", "michigan": "MI", "minnesota": "MN", "mississippi": "MS",
-        "missouri": "MO", "montana": "MT", "nebraska": "NE", "nevada": "NV",
-        "new hampshire": "NH", "new jersey": "NJ", "new mexico": "NM", "new york": "NY",
-        "north carolina": "NC", "north dakota": "ND", "ohio": "OH", "oklahoma": "OK",
-        "oregon": "OR", "pennsylvania": "PA", "rhode island": "RI", "south carolina": "SC",
-        "south dakota": "SD", "tennessee": "TN", "texas": "TX", "utah": "UT",
-        "vermont": "VT", "virginia": "VA", "washington": "WA", "west virginia": "WV",
-        "wisconsin": "WI", "wyoming": "WY", "district of columbia": "DC",
-    }
     cleaned = state_input.strip().lower()
     # Check full name first
     if cleaned in _STATES:
         return _STATES[cleaned]
     # Check if it's already a valid abbreviation
     upper = cleaned.upper()
-    if upper in _STATES.values():
+    if upper in _STATE_CODES:
         return upper
     return ""
 
 
+_ISO_DATETIME_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}T[0-9]{2}:[0-9]{2}:[0-9]{2}(\.[0-9]+)?")
+
+
 def parse_iso_date(date_str: str) -> Optional[datetime]:
     """
     Safely parse an ISO 8601 date string, returning None on failure.
@@ -179,6 +188,15 @@ def parse_iso_date(date_str: str) -> Optional[datetime]:
         return None
     # Strip trailing Z and replace with +00:00 for Python < 3.11 compat
     date_str = date_str.strip().rstrip("Z")
+    # Fast path for the common "YYYY-MM-DDTHH:MM:SS[.fff...]" shape only —
+    # fromisoformat accepts more forms than the formats below, so anything
+    # else takes the original path. The 25-char cap keeps the same 5
+    # fractional digits the strptime slice below does (USAJobs sends 7).
+    if _ISO_DATETIME_RE.fullmatch(date_str):
+        try:
+            return datetime.fromisoformat(date_str[:25])
+        except ValueError:
+            pass
     formats = [
         "%Y-%m-%dT%H:%M:%S",
         "%Y-%m-%dT%H:%M:%S.%f",
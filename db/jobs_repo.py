@@ -9,6 +9,7 @@ All timestamps stored as ISO 8601 strings in UTC.
 """
 
 import logging
+import sqlite3
 from datetime import datetime, timezone
 from typing import Optional
 from db.database import get_connection
@@ -16,7 +17,7 @@ from db.database import get_connection
 logger = logging.getLogger("jobtrack.db.repo")
 
 # Statuses that automatically record a timestamp when selected
-TIMESTAMPED_STATUSES = {
+TIMESTAMPED_STATUSES = frozenset({
     "Phone Screen",
     "Interview Scheduled",
     "Interview Completed",
@@ -25,7 +26,7 @@ TIMESTAMPED_STATUSES = {
     "Offer Accepted",
     "Offer Declined",
     "Rejected",
-}
+})
 
 ALL_STATUSES = [
     "Applied",
@@ -42,6 +43,14 @@ ALL_STATUSES = [
 ]
 
 
+_INSERT_APPLICATION = """
+    INSERT INTO applications
+        (job_id, provider, company, title, location, job_url,
+         date_applied, status, created_at, updated_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
 def add_application(job_data: dict) -> int:
     """
     Insert a new application record when the user marks a job as applied.
@@ -55,27 +64,7 @@ def add_application(job_data: dict) -> int:
     """
     conn = get_connection()
     try:
-        now = _now_iso()
-        cursor = conn.execute(
-            """
-            INSERT INTO applications
-                (job_id, provider, company, title, location, job_url,
-                 date_applied, status, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                job_data.get("job_id", ""),
-                job_data.get("provider", ""),
-                job_data.get("company", ""),
-                job_data.get("title", ""),
-                job_data.get("location", ""),
-                job_data.get("job_url", ""),
-                job_data.get("date_applied", now),
-                job_data.get("status", "Applied"),
-                now,
-                now,
-            ),
-        )
+        cursor = conn.execute(_INSERT_APPLICATION, _application_params(job_data, _now_iso()))
         conn.commit()
         new_id = cursor.lastrowid
         logger.info(f"Added application #{new_id}: {job_data.get('title')} at {job_data.get('company')}")
@@ -84,6 +73,47 @@ def add_application(job_data: dict) -> int:
         conn.close()
 
 
+def add_applications(jobs: list[dict]) -> int:
+    """
+    Insert several applications in one transaction (a single commit).
+    Used when the user marks a batch of jobs as applied in quick succession.
+
+    Args:
+        jobs: List of dicts with the same keys as add_application()
+
+    Returns:
+        Number of rows inserted.
+    """
+    if not jobs:
+        return 0
+    conn = get_connection()
+    try:
+        now = _now_iso()
+        with conn:
+            conn.executemany(_INSERT_APPLICATION,
+                             [_application_params(job, now) for job in jobs])
+        logger.info(f"Added {len(jobs)} applications")
+        return len(jobs)
+    finally:
+        conn.close()
+
+
+def _application_params(job_data: dict, now: str) -> tuple:
+    """Build the INSERT parameter tuple for one application dict."""
+    return (
+        job_data.get("job_id", ""),
+        job_data.get("provider", ""),
+        job_data.get("company", ""),
+        job_data.get("title", ""),
+        job_data.get("location", ""),
+        job_data.get("job_url", ""),
+        job_data.get("date_applied", now),
+        job_data.get("status", "Applied"),
+        now,
+        now,
+    )
+
+
 def update_status(application_id: int, new_status: str) -> None:
     """
     Update the status for an application.
@@ -152,13 +182,21 @@ def get_all_applications() -> list[dict]:
 
 def get_application(application_id: int) -> Optional[dict]:
     """Return a single application by ID, or None if not found."""
+    row = _get_application_row(application_id)
+    return dict(row) if row else None
+
+
+def _get_application_row(application_id: int) -> Optional[sqlite3.Row]:
+    """
+    Return a single application as the raw sqlite3.Row (key-indexable,
+    read-only), skipping the dict copy. For callers that only read fields.
+    """
     conn = get_connection()
     try:
-        row = conn.execute(
+        return conn.execute(
             "SELECT * FROM applications WHERE id = ?",
             (application_id,)
         ).fetchone()
-        return dict(row) if row else None
     finally:
         conn.close()
 
@@ -69,7 +69,7 @@ class AdzunaProvider(BaseProvider):
         }
 
         try:
-            response = requests.get(BASE_URL, params=params, timeout=REQUEST_TIMEOUT)
+            response = self._http_get(BASE_URL, params=params, timeout=REQUEST_TIMEOUT)
         except requests.RequestException as e:
             raise ProviderError(self.PROVIDER_ID, f"Network error: {e}")
 
@@ -96,7 +96,7 @@ class AdzunaProvider(BaseProvider):
     def validate_key(self) -> tuple:
         app_id, app_key = self._parse_creds()
         try:
-            r = requests.get(
+            r = self._http_get(
                 VALIDATE_URL,
                 params={"app_id": app_id, "app_key": app_key,
                         "results_per_page": 1, "what": "analyst"},
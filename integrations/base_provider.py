@@ -13,6 +13,7 @@ To add a new provider:
     5. Add wizard screenshots to assets/wizard_screens/myprovider/
 """
 
+import requests
 from abc import ABC, abstractmethod
 from core.job_model import JobListing
 
@@ -70,6 +71,14 @@ class BaseProvider(ABC):
         """
         ...
 
+    def _http_get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Issue a GET request. Providers route every HTTP call through here,
+        so tests can stub this one method on an instance instead of
+        patching requests.get in each provider module.
+        """
+        return requests.get(url, **kwargs)
+
     def _normalize(self, raw: dict) -> JobListing:
         """
         Convert a raw API response dict into a JobListing.
@@ -50,8 +50,8 @@ class GlassdoorProvider(BaseProvider):
         }
 
         try:
-            response = requests.get(BASE_URL, headers=headers, params=params,
-                                    timeout=REQUEST_TIMEOUT)
+            response = self._http_get(BASE_URL, headers=headers, params=params,
+                                      timeout=REQUEST_TIMEOUT)
         except requests.RequestException as e:
             raise ProviderError(self.PROVIDER_ID, f"Network error: {e}")
 
@@ -82,9 +82,9 @@ class GlassdoorProvider(BaseProvider):
     def validate_key(self) -> tuple:
         try:
             headers = {"X-RapidAPI-Key": self.api_key, "X-RapidAPI-Host": RAPIDAPI_HOST}
-            r = requests.get(BASE_URL, headers=headers,
-                             params={"query":"analyst","page":"1","num_pages":"1"},
-                             timeout=REQUEST_TIMEOUT)
+            r = self._http_get(BASE_URL, headers=headers,
+                               params={"query":"analyst","page":"1","num_pages":"1"},
+                               timeout=REQUEST_TIMEOUT)
             if r.status_code == 401: return (False, "Invalid key.")
             if r.ok:                 return (True,  "Connected to Glassdoor via RapidAPI.")
             return (False, f"HTTP {r.status_code}")
@@ -62,6 +62,19 @@ def _col_letter(n: int) -> str:
     return result
 
 
+def _application_row(job_data: dict) -> list[str]:
+    """Build a BASE_COLUMNS-ordered sheet row from an application dict."""
+    return [
+        job_data.get("company", ""),
+        job_data.get("title", ""),
+        job_data.get("location", ""),
+        job_data.get("provider", ""),
+        job_data.get("job_url", ""),
+        job_data.get("date_applied", "")[:10],  # Date only
+        job_data.get("status", "Applied"),
+    ]
+
+
 class GoogleSheetsTracker:
     """Manages creating, reading, and writing the job application tracker sheet."""
 
@@ -191,7 +204,7 @@ class GoogleSheetsTracker:
             self._format_header_row(ws)
 
         self._worksheet = self._spreadsheet.worksheet(SHEET_TAB_NAME)
-        self._headers = self._worksheet.row_values(1)
+        self._headers = list(self._worksheet.row_values(1))
         return self._spreadsheet
 
     def _get_or_create_folder(self) -> str:
@@ -258,15 +271,7 @@ class GoogleSheetsTracker:
             The 1-based row index of the newly appended row.
         """
         self._ensure_worksheet()
-        row = [
-            job_data.get("company", ""),
-            job_data.get("title", ""),
-            job_data.get("location", ""),
-            job_data.get("provider", ""),
-            job_data.get("job_url", ""),
-            job_data.get("date_applied", "")[:10],  # Date only
-            job_data.get("status", "Applied"),
-        ]
+        row = _application_row(job_data)
         self._worksheet.append_row(row, value_input_option="USER_ENTERED")
         # Row count = data rows + 1 header
         row_index = len(self._worksheet.get_all_values())
@@ -277,6 +282,7 @@ class GoogleSheetsTracker:
         """
         Update the Status cell for a row and write a timestamp to the
         appropriate timeline column (creating it if it doesn't exist yet).
+        Both cells are written in a single batch_update request.
 
         Args:
             row_index: 1-based row number in the spreadsheet (2+ for data rows)
@@ -287,13 +293,20 @@ class GoogleSheetsTracker:
 
         # Update the Status column (G = 7)
         status_col = BASE_COLUMNS.index("Status") + 1  # 1-based
-        self._worksheet.update_cell(row_index, status_col, status)
+        updates = [{
+            "range":  f"{_col_letter(status_col)}{row_index}",
+            "values": [[status]],
+        }]
 
         # Write timestamp to timeline column if this status gets one
         if status in TIMELINE_STATUSES:
             col_idx = self._ensure_timeline_column(status)
-            self._worksheet.update_cell(row_index, col_idx, timestamp[:19])
+            updates.append({
+                "range":  f"{_col_letter(col_idx)}{row_index}",
+                "values": [[timestamp[:19]]],
+            })
 
+        self._worksheet.batch_update(updates, value_input_option="USER_ENTERED")
         logger.info(f"Updated row {row_index} status → {status}")
 
     def _ensure_timeline_column(self, status: str) -> int:
@@ -305,7 +318,8 @@ class GoogleSheetsTracker:
             1-based column index.
         """
         col_header = f"{status} Date"
-        self._headers = self._worksheet.row_values(1)
+        # Copy — the header list is appended to below
+        self._headers = list(self._worksheet.row_values(1))
 
         if col_header in self._headers:
             return self._headers.index(col_header) + 1  # 1-based
@@ -334,6 +348,9 @@ class GoogleSheetsTracker:
         Only appends rows that don't already exist (matched by job_id or URL).
         Updates status for rows that have changed.
 
+        New rows are sent in one append_rows request rather than one
+        append_row call each — Sheets quotas are per request, not per row.
+
         Args:
             applications: List of dicts from jobs_repo.get_all_applications()
 
@@ -345,6 +362,7 @@ class GoogleSheetsTracker:
         existing_urls = {row.get("Job URL", "") for row in existing}
 
         stats = {"appended": 0, "updated": 0, "skipped": 0}
+        new_rows = []
 
         for app in applications:
             url = app.get("job_url", "")
@@ -352,8 +370,11 @@ class GoogleSheetsTracker:
                 stats["skipped"] += 1
                 continue
 
-            self.append_application(app)
-            stats["appended"] += 1
+            new_rows.append(_application_row(app))
+
+        if new_rows:
+            self._worksheet.append_rows(new_rows, value_input_option="USER_ENTERED")
+            stats["appended"] = len(new_rows)
 
         logger.info(f"sync_from_local: {stats}")
         return stats
@@ -68,7 +68,7 @@ class IndeedProvider(BaseProvider):
         }
 
         try:
-            response = requests.get(
+            response = self._http_get(
                 BASE_URL, headers=headers, params=params,
                 timeout=REQUEST_TIMEOUT)
         except requests.RequestException as e:
@@ -102,7 +102,7 @@ class IndeedProvider(BaseProvider):
                 "X-RapidAPI-Key":  self.api_key,
                 "X-RapidAPI-Host": RAPIDAPI_HOST,
             }
-            response = requests.get(
+            response = self._http_get(
                 BASE_URL,
                 headers=headers,
                 params={"query": "analyst", "page": "1", "num_pages": "1"},
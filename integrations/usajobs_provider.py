@@ -11,13 +11,21 @@ Authentication uses two headers:
     User-Agent:        <your registered email address>
 
 Both stored in keyring: "usajobs" (key) and "usajobs_email" (email).
+
+Listings do not keep the raw MatchedObjectDescriptor by default (each is
+several KB and nothing in the app reads it). Pass keep_raw=True when
+debugging a normalization issue to have JobListing.raw populated.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Optional
 import requests
+from requests.adapters import HTTPAdapter
 
 from core.job_model import JobListing
+from core.utils import parse_iso_date
 from integrations.base_provider import BaseProvider, ProviderError
 
 logger = logging.getLogger("jobtrack.usajobs")
@@ -27,7 +35,12 @@ _WORK_SCHEDULE_MAP = {
     "Shift": "full_time", "Intermittent": "contract",
     "Job Sharing": "part_time", "Multiple Schedules": "full_time",
 }
-_PAY_INTERVAL_MAP = {"PA": "annual", "PH": "hourly", "BW": "annual", "WC": "annual"}
+# RateIntervalCode → (salary_interval, multiplier to reach that interval)
+_PAY_INTERVAL_MAP = {
+    "PA": ("annual", 1),   "PH": ("hourly", 1),   "WC": ("annual", 1),
+    "BW": ("annual", 26),  "PW": ("annual", 52),  "PM": ("annual", 12),
+    "PD": ("annual", 260),
+}
 _ENTRY_KEYWORDS = {"entry", "junior", "gs-01", "gs-02", "gs-03", "gs-04", "gs-05", "gs-06", "gs-07"}
 _SENIOR_KEYWORDS = {"senior", "lead", "principal", "gs-13", "gs-14", "gs-15", "ses"}
 
@@ -46,6 +59,9 @@ _FEDERAL_SYNONYMS = [
 # USAJobs API is slow — too many individual searches will time out.
 _MAX_INDIVIDUAL_SEARCHES = 5
 
+# Upper bound on concurrent keyword queries; matches the session pool size.
+_MAX_WORKERS = 8
+
 
 class UsajobsProvider(BaseProvider):
     """Fetches job listings from the USAJobs.gov API."""
@@ -56,9 +72,19 @@ class UsajobsProvider(BaseProvider):
     IS_FREE      = True
     BASE_URL     = "https://data.usajobs.gov/api/search"
 
-    def __init__(self, api_key: str, user_email: str):
+    def __init__(self, api_key: str, user_email: str, keep_raw: bool = False):
         super().__init__(api_key)
         self.user_email = user_email
+        self._keep_raw = keep_raw
+        # One keep-alive session per provider so every keyword query in a
+        # search reuses the same TLS connection to data.usajobs.gov.
+        self._session = requests.Session()
+        self._session.headers.update(self._headers())
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("https://", adapter)
+
+    def _http_get(self, url: str, **kwargs) -> requests.Response:
+        return self._session.get(url, **kwargs)
 
     def _headers(self) -> dict:
         return {
@@ -96,67 +122,88 @@ class UsajobsProvider(BaseProvider):
 
         per_search = max(10, min(max_results, 25))
 
-        for term in search_terms:
-            params = {
-                "Keyword":        term,
-                "LocationName":   location,
-                "Radius":         str(radius_miles),
-                "ResultsPerPage": str(per_search),
-                "Fields":         "min",
-                "SortField":      "OpenDate",
-                "SortDirection":  "Desc",
-            }
-            logger.debug(f"USAJobs search: keyword='{term}' location='{location}'")
-            try:
-                response = requests.get(
-                    self.BASE_URL, headers=self._headers(),
-                    params=params, timeout=15,
-                )
-            except requests.RequestException as e:
-                raise ProviderError(self.PROVIDER_ID, f"Network error: {e}")
-
-            if response.status_code == 401:
-                raise ProviderError(self.PROVIDER_ID, "Invalid API key or email.", 401)
-            if response.status_code == 429:
-                raise ProviderError(self.PROVIDER_ID, "Rate limit reached.", 429)
-            if response.status_code != 200:
-                logger.warning(f"USAJobs: HTTP {response.status_code} for '{term}' — skipping")
-                continue
-
-            try:
-                data = response.json()
-            except ValueError as e:
-                logger.warning(f"USAJobs: Invalid JSON for '{term}' — {e}")
-                continue
-
-            items = data.get("SearchResult", {}).get("SearchResultItems", [])
-            logger.info(f"USAJobs: {len(items)} results for '{term}' near '{location}'")
-
+        def merge(term: str, items: list) -> None:
             for item in items:
-                descriptor = item.get("MatchedObjectDescriptor", item)
+                descriptor = item.get("MatchedObjectDescriptor", item) if isinstance(item, dict) else None
+                if not isinstance(descriptor, dict):
+                    logger.warning(f"USAJobs: skipping malformed result for '{term}'")
+                    continue
                 pos_id = descriptor.get("PositionID") or descriptor.get("MatchedObjectId")
                 if pos_id and pos_id not in all_items:
                     all_items[pos_id] = item
 
-            # Stop early if we have enough results
-            if len(all_items) >= max_results:
-                break
+        # The first term runs alone: when its page already fills max_results
+        # no further queries are sent, as in the old serial loop. Otherwise
+        # the remaining terms run concurrently and are consumed in term order,
+        # so dedup, truncation and the first ProviderError (401/429/network)
+        # match a serial loop; queries not yet started are cancelled once
+        # the cap is reached.
+        first, rest = search_terms[0], search_terms[1:]
+        merge(first, self._search_term(first, location, radius_miles, per_search))
+
+        if rest and len(all_items) < max_results:
+            ex = ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(rest)))
+            try:
+                futures = [
+                    ex.submit(self._search_term, term, location, radius_miles, per_search)
+                    for term in rest
+                ]
+                for term, future in zip(rest, futures):
+                    merge(term, future.result())
+                    if len(all_items) >= max_results:
+                        break
+            finally:
+                ex.shutdown(wait=True, cancel_futures=True)
 
         logger.info(f"USAJobs: {len(all_items)} unique results total")
 
         listings = []
-        for item in list(all_items.values())[:max_results]:
+        for item in islice(all_items.values(), max_results):
             try:
                 listings.append(self._normalize(item))
             except Exception as e:
                 logger.warning(f"USAJobs normalize error: {e}")
         return listings
 
+    def _search_term(self, term: str, location: str, radius_miles: int, per_search: int) -> list:
+        """Run one keyword query and return its raw SearchResultItems."""
+        params = {
+            "Keyword":        term,
+            "LocationName":   location,
+            "Radius":         str(radius_miles),
+            "ResultsPerPage": str(per_search),
+            "Fields":         "min",
+            "SortField":      "OpenDate",
+            "SortDirection":  "Desc",
+        }
+        logger.debug(f"USAJobs search: keyword='{term}' location='{location}'")
+        try:
+            response = self._http_get(self.BASE_URL, params=params, timeout=15)
+        except requests.RequestException as e:
+            raise ProviderError(self.PROVIDER_ID, f"Network error: {e}")
+
+        if response.status_code == 401:
+            raise ProviderError(self.PROVIDER_ID, "Invalid API key or email.", 401)
+        if response.status_code == 429:
+            raise ProviderError(self.PROVIDER_ID, "Rate limit reached.", 429)
+        if response.status_code != 200:
+            logger.warning(f"USAJobs: HTTP {response.status_code} for '{term}' — skipping")
+            return []
+
+        try:
+            data = response.json()
+        except ValueError as e:
+            logger.warning(f"USAJobs: Invalid JSON for '{term}' — {e}")
+            return []
+
+        items = data.get("SearchResult", {}).get("SearchResultItems", [])
+        logger.info(f"USAJobs: {len(items)} results for '{term}' near '{location}'")
+        return items
+
     def validate_key(self) -> tuple:
         try:
-            r = requests.get(
+            r = self._http_get(
                 self.BASE_URL,
-                headers=self._headers(),
                 params={"Keyword": "analyst", "ResultsPerPage": "1"},
                 timeout=10,
             )
@@ -216,11 +263,11 @@ class UsajobsProvider(BaseProvider):
         except (TypeError, ValueError):
             salary_min = salary_max = None
 
-        pay_code        = pay.get("RateIntervalCode", "PA")
-        salary_interval = _PAY_INTERVAL_MAP.get(pay_code, "annual")
-        if pay_code == "BW":
-            if salary_min: salary_min *= 26
-            if salary_max: salary_max *= 26
+        salary_interval, multiplier = _PAY_INTERVAL_MAP.get(
+            pay.get("RateIntervalCode", "PA"), ("annual", 1))
+        if multiplier != 1:
+            if salary_min: salary_min *= multiplier
+            if salary_max: salary_max *= multiplier
 
         schedule      = item.get("PositionSchedule", [{}])
         schedule_code = schedule[0].get("Code", "") if schedule else ""
@@ -236,7 +283,6 @@ class UsajobsProvider(BaseProvider):
         else:
             experience_level = "mid"
 
-        from core.utils import parse_iso_date
         date_posted  = parse_iso_date(item.get("PublicationStartDate", ""))
         closing_date = parse_iso_date(item.get("ApplicationCloseDate", ""))
         description  = details.get("JobSummary", "").strip()
@@ -254,5 +300,5 @@ class UsajobsProvider(BaseProvider):
             salary_interval=salary_interval,
             employment_type=employment_type,
             experience_level=experience_level,
-            raw=raw,
+            raw=raw if self._keep_raw else None,
         )
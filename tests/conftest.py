@@ -0,0 +1,114 @@
+"""
+tests/conftest.py
+===================
+Shared pytest fixtures.
+
+in_memory_db swaps db.database / db.jobs_repo onto an in-memory SQLite
+database so tests never touch the real AppData file. sample_job builds
+application dicts for jobs_repo.add_application().
+"""
+
+import os
+import pytest
+import sqlite3
+import uuid
+from pathlib import Path
+from types import MappingProxyType
+from db import jobs_repo
+from db import database
+
+# Read once at import; executed once per session by shared_db
+_SCHEMA_SQL = (Path(__file__).parent.parent / "db" / "schema.sql").read_text(encoding="utf-8")
+
+# Per-connection settings, applied in one executescript call. Durability
+# is irrelevant for a throwaway test database. foreign_keys comes last so
+# cascade-delete tests always run with FK enforcement.
+_PRAGMA_PREAMBLE = """
+PRAGMA journal_mode = MEMORY;
+PRAGMA synchronous = OFF;
+PRAGMA temp_store = MEMORY;
+PRAGMA locking_mode = EXCLUSIVE;
+PRAGMA foreign_keys = ON;
+"""
+
+
+# Empties every data table and resets AUTOINCREMENT counters; metadata
+# (schema_version) is left alone. Cheaper than rebuilding the database.
+_WIPE_SQL = """
+DELETE FROM timeline_events;
+DELETE FROM sheets_sync;
+DELETE FROM commute_cache;
+DELETE FROM applications;
+DELETE FROM sqlite_sequence;
+"""
+
+
+@pytest.fixture(scope="session")
+def shared_db():
+    """
+    One shared-cache in-memory database for the whole session, with the
+    schema built once. The keeper connection holds it open.
+
+    Under pytest-xdist each worker runs its own session, so the database
+    name carries the worker id ("gw0", "gw1", …) to keep them apart.
+
+    Yields:
+        (uri, keeper) — connect to uri for test handles; keeper is used
+        to wipe the tables between tests.
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+    uri = f"file:jobtrack_test_{worker}_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    keeper = sqlite3.connect(uri, uri=True)
+    keeper.executescript(_PRAGMA_PREAMBLE + _SCHEMA_SQL)
+    keeper.commit()
+    yield uri, keeper
+    keeper.close()
+
+
+@pytest.fixture
+def in_memory_db(monkeypatch, shared_db):
+    """
+    Replace get_connection with connections to the shared in-memory
+    database. jobs_repo opens and closes a connection per call, so every
+    call must see the same data; a private :memory: database per call
+    would start empty each time.
+
+    jobs_repo commits on its own connections, so a per-test transaction
+    can't be rolled back; instead the tables are wiped at teardown, and
+    each test still starts from an empty database.
+    """
+    uri, keeper = shared_db
+
+    def make_connection():
+        conn = sqlite3.connect(uri, uri=True)
+        conn.row_factory = sqlite3.Row
+        conn.executescript(_PRAGMA_PREAMBLE)
+        return conn
+
+    monkeypatch.setattr(database, "get_connection", make_connection)
+    monkeypatch.setattr(jobs_repo, "get_connection", make_connection)
+    yield make_connection
+    keeper.executescript(_WIPE_SQL)
+
+
+_SAMPLE_BASE = MappingProxyType({
+    "job_id": "usajobs_TEST001",
+    "provider": "usajobs",
+    "company": "Cybersecurity and Infrastructure Security Agency",
+    "title": "Information Security Analyst",
+    "location": "Dallas, TX",
+    "job_url": "https://www.usajobs.gov/job/TEST001",
+    "date_applied": "2026-02-19T14:00:00+00:00",
+    "status": "Applied",
+})
+
+
+@pytest.fixture
+def sample_job():
+    """
+    Factory for sample job_data dicts.
+    Call with keyword overrides: sample_job(job_id="a", title="Job A").
+    """
+    def _build(**overrides) -> dict:
+        return {**_SAMPLE_BASE, **overrides}
+    return _build
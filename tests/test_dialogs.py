@@ -301,6 +301,82 @@ class TestApiKeySaveLogic:
         assert "anthropic" in saved
         assert "openrouteservice" not in saved   # Empty — should not be written
 
+    def _dialog_for_save(self, originals: dict, entered: dict):
+        """
+        A PreferencesDialog with no Tk window behind it, wired with just what
+        _save() reads when only the Location and Providers tabs were opened.
+        """
+        from ui.dialogs.preferences_dialog import PreferencesDialog, _TOGGLEABLE_PROVIDERS
+        dlg = PreferencesDialog.__new__(PreferencesDialog)
+        dlg._config = _base_config()
+        dlg._on_save = None
+        dlg._widgets = {
+            "loc_city":   MagicMock(get=lambda: "Forney"),
+            "loc_state":  MagicMock(get=lambda: "TX"),
+            "loc_zip":    MagicMock(get=lambda: "75126"),
+            "radius_var": MagicMock(get=lambda: 50),
+        }
+        dlg._built_tabs = {"Location", "Providers & Keys"}
+        dlg._enabled_vars = {pid: MagicMock(get=lambda: False) for pid in _TOGGLEABLE_PROVIDERS}
+        dlg._key_entries = {k: MagicMock(get=lambda v=v: v) for k, v in entered.items()}
+        dlg._key_originals = dict(originals)
+        dlg._key_results = None
+        dlg._key_failures = []
+        dlg._status = MagicMock()
+        dlg.after = MagicMock()
+        dlg.winfo_exists = MagicMock(return_value=True)
+        return dlg
+
+    def _run_save(self, dlg, save_key):
+        """Call the real _save(), wait for the keyring writer, then drain its results."""
+        import threading
+        from core import config_manager, keyring_manager
+        with patch.object(config_manager, "save"), \
+             patch.object(keyring_manager, "save_key", side_effect=save_key):
+            threads = []
+            real_thread = threading.Thread
+
+            def _track(*a, **kw):
+                t = real_thread(*a, **kw)
+                threads.append(t)
+                return t
+
+            with patch("ui.dialogs.preferences_dialog.threading.Thread", side_effect=_track):
+                dlg._save()
+            for t in threads:
+                t.join(timeout=5)
+                assert not t.daemon
+            if dlg._key_results is not None:
+                dlg._poll_key_save()
+
+    def test_save_writes_only_changed_keys(self):
+        saved = {}
+        dlg = self._dialog_for_save({"anthropic": "sk-ant-test", "adzuna": "old"},
+                                    {"anthropic": "sk-ant-test", "adzuna": "new"})
+        self._run_save(dlg, lambda k, v: saved.update({k: v}))
+        assert saved == {"adzuna": "new"}
+        assert dlg._key_originals["adzuna"] == "new"
+        dlg._status.configure.assert_called_with(text="✅  Saved")
+
+    def test_save_key_failure_reported_and_retried(self):
+        from keyring.errors import KeyringError
+
+        def _fail(k, v):
+            raise KeyringError("locked")
+
+        dlg = self._dialog_for_save({"adzuna": "old"}, {"adzuna": "new"})
+        self._run_save(dlg, _fail)
+        assert dlg._key_originals["adzuna"] == "old"     # Not marked as stored
+        status = dlg._status.configure.call_args[1]["text"]
+        assert "adzuna" in status and "Saved" not in status
+        assert not any(c.args and c.args[1] == dlg.destroy for c in dlg.after.call_args_list)
+
+        # A second Save retries the failed key
+        saved = {}
+        self._run_save(dlg, lambda k, v: saved.update({k: v}))
+        assert saved == {"adzuna": "new"}
+        dlg._status.configure.assert_called_with(text="✅  Saved")
+
     def test_all_key_fields_covered(self):
         """Verify the full set of API key fields the dialog writes."""
         expected_fields = {
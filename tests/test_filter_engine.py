@@ -88,6 +88,17 @@ class TestFilterByRadius:
         assert len(result_50) == 0
         assert len(result_100) == 1
 
+    def test_matches_is_within_radius_per_job(self):
+        """The batch path must agree with the scalar haversine check."""
+        jobs = [
+            _job(job_id=f"{lat}_{lon}", latitude=lat, longitude=lon)
+            for lat in (25.0, 30.0, 32.5, 33.0, 36.0, 45.0)
+            for lon in (-120.0, -100.0, -97.0, -96.5, -90.0)
+        ]
+        for radius in (10, 50, 300, 2000, 20000):
+            expected = [j for j in jobs if j.is_within_radius(32.7459, -96.4685, radius)]
+            assert filter_engine.filter_by_radius(jobs, 32.7459, -96.4685, radius) == expected
+
 
 # ── filter_by_work_type ───────────────────────────────────────────────────────
 
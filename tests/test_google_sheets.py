@@ -5,8 +5,10 @@ Tests for integrations/google_sheets.py and sheets_sync_manager.py.
 All Google API calls are mocked — no network, no credentials needed.
 """
 
+import gspread
 import pytest
-from unittest.mock import MagicMock, patch, call
+from types import MappingProxyType
+from unittest.mock import MagicMock, NonCallableMagicMock, patch, call
 from integrations.google_sheets import (
     GoogleSheetsTracker,
     BASE_COLUMNS,
@@ -14,6 +16,11 @@ from integrations.google_sheets import (
     SHEET_TAB_NAME,
     _col_letter,
 )
+from integrations import sheets_sync_manager
+
+# Keep this file on one worker under `pytest -n auto --dist loadgroup`;
+# other files are distributed across the remaining workers.
+pytestmark = pytest.mark.xdist_group("sheets")
 
 
 # ── _col_letter ───────────────────────────────────────────────────────────────
@@ -36,39 +43,48 @@ class TestColLetter:
 
 # ── Constants ─────────────────────────────────────────────────────────────────
 
-class TestConstants:
-
-    def test_base_columns_correct_order(self):
-        assert BASE_COLUMNS[0] == "Company"
-        assert BASE_COLUMNS[1] == "Job Title"
-        assert BASE_COLUMNS[6] == "Status"
-        assert len(BASE_COLUMNS) == 7
+_CONSTANT_CHECKS = {
+    "company_first":            lambda: BASE_COLUMNS[0] == "Company",
+    "job_title_second":         lambda: BASE_COLUMNS[1] == "Job Title",
+    "status_seventh":           lambda: BASE_COLUMNS[6] == "Status",
+    "seven_base_columns":       lambda: len(BASE_COLUMNS) == 7,
+    "timeline_nonempty":        lambda: len(TIMELINE_STATUSES) > 0,
+    "phone_screen_timeline":    lambda: "Phone Screen" in TIMELINE_STATUSES,
+    "offer_received_timeline":  lambda: "Offer Received" in TIMELINE_STATUSES,
+    "applied_not_timeline":     lambda: "Applied" not in TIMELINE_STATUSES,
+    "no_response_not_timeline": lambda: "No Response" not in TIMELINE_STATUSES,
+}
 
-    def test_timeline_statuses_nonempty(self):
-        assert len(TIMELINE_STATUSES) > 0
 
-    def test_phone_screen_is_timeline_status(self):
-        assert "Phone Screen" in TIMELINE_STATUSES
+class TestConstants:
 
-    def test_offer_received_is_timeline_status(self):
-        assert "Offer Received" in TIMELINE_STATUSES
+    @pytest.mark.parametrize("check", list(_CONSTANT_CHECKS.values()),
+                             ids=list(_CONSTANT_CHECKS))
+    def test_constant(self, check):
+        assert check()
 
-    def test_applied_is_not_timeline_status(self):
-        assert "Applied" not in TIMELINE_STATUSES
 
-    def test_no_response_is_not_timeline_status(self):
-        assert "No Response" not in TIMELINE_STATUSES
+# ── GoogleSheetsTracker fixtures ──────────────────────────────────────────────
 
+# Header rows the tests feed to row_values(1), built once at import.
+# Tuples, as gspread's own row_values() result must be treated read-only.
+_HEADER_VARIANTS = {
+    "base":       tuple(BASE_COLUMNS),
+    "plus_phone": tuple(BASE_COLUMNS) + ("Phone Screen Date",),
+    "plus_two":   tuple(BASE_COLUMNS) + ("Phone Screen Date",
+                                         "Interview Scheduled Date"),
+}
 
-# ── GoogleSheetsTracker fixtures ──────────────────────────────────────────────
 
 def _make_tracker(authenticated=True) -> GoogleSheetsTracker:
     """Return a tracker with a mocked gspread client."""
     tracker = GoogleSheetsTracker(token_path="/tmp/fake_token.json")
     if authenticated:
         tracker._client = MagicMock()
-        mock_ws = MagicMock()
-        mock_ws.row_values.return_value = BASE_COLUMNS[:]
+        # Non-callable, spec'd mocks: cheaper to build and reject typos
+        # in attribute names that a real gspread object wouldn't have.
+        mock_ws = NonCallableMagicMock(spec_set=gspread.Worksheet)
+        mock_ws.row_values.return_value = _HEADER_VARIANTS["base"]
         mock_ws.get_all_values.return_value = [BASE_COLUMNS] + [
             ["CISA","SOC Analyst","Dallas, TX","usajobs",
              "https://usajobs.gov/1","2026-02-01","Applied"]
@@ -78,13 +94,13 @@ def _make_tracker(authenticated=True) -> GoogleSheetsTracker:
              "Provider":"usajobs","Job URL":"https://usajobs.gov/1",
              "Date Applied":"2026-02-01","Status":"Applied"}
         ]
-        mock_ss = MagicMock()
+        mock_ss = NonCallableMagicMock(spec_set=gspread.Spreadsheet)
         mock_ss.worksheet.return_value = mock_ws
         mock_ss.sheet1 = mock_ws
         mock_ss.id = "fake_spreadsheet_id"
         tracker._spreadsheet = mock_ss
         tracker._worksheet   = mock_ws
-        tracker._headers     = BASE_COLUMNS[:]
+        tracker._headers     = list(_HEADER_VARIANTS["base"])
     return tracker
 
 
@@ -98,34 +114,37 @@ class TestIsAuthenticated:
 
     def test_returns_false_without_client(self):
         t = _make_tracker(authenticated=False)
-        with patch.object(t, "load_saved_credentials", return_value=False):
-            assert t.is_authenticated() is False
+        # Instance attribute shadows the method; t is discarded after the test
+        t.load_saved_credentials = lambda: False
+        assert t.is_authenticated() is False
 
     def test_attempts_load_when_no_client(self):
         t = _make_tracker(authenticated=False)
-        with patch.object(t, "load_saved_credentials", return_value=True) as mock_load:
-            t.is_authenticated()
-            mock_load.assert_called_once()
+        t.load_saved_credentials = MagicMock(return_value=True)
+        t.is_authenticated()
+        t.load_saved_credentials.assert_called_once()
 
 
 # ── append_application ────────────────────────────────────────────────────────
 
+# Read-only base application; tests override fields with {**_JOB_DATA_APPLIED, ...}
+_JOB_DATA_APPLIED = MappingProxyType({
+    "company":      "CISA",
+    "title":        "SOC Analyst",
+    "location":     "Dallas, TX",
+    "provider":     "usajobs",
+    "job_url":      "https://usajobs.gov/1",
+    "date_applied": "2026-02-01T12:00:00",
+    "status":       "Applied",
+})
+
+
 class TestAppendApplication:
 
     def test_appends_row_in_correct_column_order(self):
         t = _make_tracker()
         t._worksheet.get_all_values.return_value = [BASE_COLUMNS, ["row2"]]
-
-        job_data = {
-            "company":      "CISA",
-            "title":        "SOC Analyst",
-            "location":     "Dallas, TX",
-            "provider":     "usajobs",
-            "job_url":      "https://usajobs.gov/1",
-            "date_applied": "2026-02-01T12:00:00",
-            "status":       "Applied",
-        }
-        t.append_application(job_data)
+        t.append_application(dict(_JOB_DATA_APPLIED))
         call_args = t._worksheet.append_row.call_args[0][0]
         assert call_args[0] == "CISA"
         assert call_args[1] == "SOC Analyst"
@@ -134,9 +153,7 @@ class TestAppendApplication:
     def test_date_applied_truncated_to_date_only(self):
         t = _make_tracker()
         t._worksheet.get_all_values.return_value = [BASE_COLUMNS, ["r"]]
-        t.append_application({"date_applied": "2026-02-01T14:30:00",
-                               "company":"X","title":"Y","location":"Z",
-                               "provider":"p","job_url":"u","status":"Applied"})
+        t.append_application({**_JOB_DATA_APPLIED, "date_applied": "2026-02-01T14:30:00"})
         row = t._worksheet.append_row.call_args[0][0]
         assert row[5] == "2026-02-01"   # No time component
 
@@ -144,10 +161,7 @@ class TestAppendApplication:
         t = _make_tracker()
         # 1 header + 1 existing + 1 new = 3 rows total
         t._worksheet.get_all_values.return_value = [BASE_COLUMNS, ["r1"], ["r2"]]
-        result = t.append_application({
-            "company":"X","title":"Y","location":"Z",
-            "provider":"p","job_url":"u","date_applied":"2026-01-01","status":"Applied"
-        })
+        result = t.append_application({**_JOB_DATA_APPLIED, "date_applied": "2026-01-01"})
         assert result == 3
 
     def test_missing_fields_default_to_empty_string(self):
@@ -162,38 +176,45 @@ class TestAppendApplication:
 
 class TestUpdateStatus:
 
+    def _ranges(self, t) -> dict:
+        """Map each A1 range in the single batch_update call to its value."""
+        updates = t._worksheet.batch_update.call_args[0][0]
+        return {u["range"]: u["values"][0][0] for u in updates}
+
     def test_updates_status_cell(self):
         t = _make_tracker()
         t.update_status(3, "Applied", "2026-02-01T12:00:00")
         # Status is column 7 (G)
-        calls = t._worksheet.update_cell.call_args_list
-        status_call = [c for c in calls if c[0][1] == 7]
-        assert len(status_call) >= 1
-        assert status_call[0][0][2] == "Applied"
+        assert self._ranges(t)["G3"] == "Applied"
 
     def test_non_timeline_status_no_extra_column(self):
         """Applied and No Response should not add a timeline column."""
         t = _make_tracker()
         t.update_status(2, "Applied", "2026-02-01T12:00:00")
-        # Only one update_cell call — the status column itself
-        assert t._worksheet.update_cell.call_count == 1
+        # Only the status column itself
+        assert list(self._ranges(t)) == ["G2"]
+        t._worksheet.update_cell.assert_not_called()
 
     def test_timeline_status_writes_timestamp(self):
         """Phone Screen should update status AND write a timestamp column."""
         t = _make_tracker()
-        t._worksheet.row_values.return_value = BASE_COLUMNS[:]
         t.update_status(3, "Phone Screen", "2026-02-15T09:30:00")
-        # Should have called update_cell at least twice (status + timestamp)
-        assert t._worksheet.update_cell.call_count >= 2
+        assert self._ranges(t) == {"G3": "Phone Screen",
+                                   "H3": "2026-02-15T09:30:00"}
+
+    def test_update_status_uses_batch_update(self):
+        """Status + timestamp go out as one request, not one per cell."""
+        t = _make_tracker()
+        t._worksheet.row_values.return_value = _HEADER_VARIANTS["plus_phone"]
+        t.update_status(3, "Phone Screen", "2026-02-15T09:30:00")
+        assert t._worksheet.batch_update.call_count == 1
+        t._worksheet.update_cell.assert_not_called()
 
     def test_timestamp_truncated_to_seconds(self):
         """Timestamp stored in sheet should not have microseconds."""
         t = _make_tracker()
-        t._worksheet.row_values.return_value = BASE_COLUMNS[:]
         t.update_status(2, "Phone Screen", "2026-02-15T09:30:00.123456")
-        calls = t._worksheet.update_cell.call_args_list
-        ts_calls = [c for c in calls if "2026" in str(c[0][2])]
-        assert ts_calls[0][0][2] == "2026-02-15T09:30:00"
+        assert self._ranges(t)["H2"] == "2026-02-15T09:30:00"
 
 
 # ── _ensure_timeline_column ───────────────────────────────────────────────────
@@ -202,28 +223,37 @@ class TestEnsureTimelineColumn:
 
     def test_returns_existing_column_index(self):
         t = _make_tracker()
-        headers = BASE_COLUMNS + ["Phone Screen Date"]
-        t._worksheet.row_values.return_value = headers
-        t._headers = headers
+        t._worksheet.row_values.return_value = _HEADER_VARIANTS["plus_phone"]
+        t._headers = list(_HEADER_VARIANTS["plus_phone"])
         idx = t._ensure_timeline_column("Phone Screen")
         assert idx == 8   # 7 base cols + 1 = col 8
         t._worksheet.update_cell.assert_not_called()
 
     def test_creates_new_column_if_missing(self):
         t = _make_tracker()
-        t._worksheet.row_values.return_value = BASE_COLUMNS[:]
-        t._headers = BASE_COLUMNS[:]
+        t._worksheet.row_values.return_value = _HEADER_VARIANTS["base"]
+        t._headers = list(_HEADER_VARIANTS["base"])
         idx = t._ensure_timeline_column("Phone Screen")
         assert idx == 8   # First timeline column
         t._worksheet.update_cell.assert_called_once_with(1, 8, "Phone Screen Date")
 
     def test_second_timeline_column_is_9(self):
         t = _make_tracker()
-        headers = BASE_COLUMNS + ["Phone Screen Date"]
-        t._worksheet.row_values.return_value = headers
-        t._headers = headers
+        t._worksheet.row_values.return_value = _HEADER_VARIANTS["plus_phone"]
+        t._headers = list(_HEADER_VARIANTS["plus_phone"])
         idx = t._ensure_timeline_column("Interview Scheduled")
         assert idx == 9
+        # The shared header row handed out by row_values must be untouched
+        assert _HEADER_VARIANTS["plus_phone"][-1] == "Phone Screen Date"
+        assert t._headers[-1] == "Interview Scheduled Date"
+
+    def test_existing_second_column_not_recreated(self):
+        t = _make_tracker()
+        t._worksheet.row_values.return_value = _HEADER_VARIANTS["plus_two"]
+        t._headers = list(_HEADER_VARIANTS["plus_two"])
+        idx = t._ensure_timeline_column("Interview Scheduled")
+        assert idx == 9
+        t._worksheet.update_cell.assert_not_called()
 
 
 # ── get_all_applications ──────────────────────────────────────────────────────
@@ -265,14 +295,14 @@ class TestSyncFromLocal:
 
     def test_appends_new_applications(self):
         t = _make_tracker()
-        t._worksheet.get_all_values.return_value = [BASE_COLUMNS, ["r"]]
         apps = [{"job_url": "https://usajobs.gov/NEW",
                  "company":"FBI","title":"Security Analyst","location":"DC",
                  "provider":"usajobs","date_applied":"2026-02-01","status":"Applied"}]
-        with patch.object(t, "append_application", return_value=3) as mock_append:
-            stats = t.sync_from_local(apps)
+        stats = t.sync_from_local(apps)
         assert stats["appended"] == 1
-        mock_append.assert_called_once()
+        rows = t._worksheet.append_rows.call_args[0][0]
+        assert rows == [["FBI", "Security Analyst", "DC", "usajobs",
+                         "https://usajobs.gov/NEW", "2026-02-01", "Applied"]]
 
     def test_mixed_new_and_existing(self):
         t = _make_tracker()
@@ -285,11 +315,28 @@ class TestSyncFromLocal:
              "company":"NSA","title":"Intel Analyst","location":"MD",
              "provider":"usajobs","date_applied":"2026-01-15","status":"Applied"},
         ]
-        with patch.object(t, "append_application", return_value=3):
-            stats = t.sync_from_local(apps)
+        stats = t.sync_from_local(apps)
         assert stats["appended"] == 1
         assert stats["skipped"]  == 1
 
+    def test_sync_from_local_uses_single_append_request(self):
+        """Fifty new rows should cost one append request, not fifty."""
+        t = _make_tracker()
+        apps = [{"job_url": f"https://usajobs.gov/new{i}",
+                 "company":"CISA","title":"SOC","location":"TX",
+                 "provider":"usajobs","date_applied":"2026-01-01","status":"Applied"}
+                for i in range(50)]
+        stats = t.sync_from_local(apps)
+        assert stats["appended"] == 50
+        assert t._worksheet.append_rows.call_count == 1
+        assert len(t._worksheet.append_rows.call_args[0][0]) == 50
+        t._worksheet.append_row.assert_not_called()
+
+    def test_no_append_request_when_nothing_new(self):
+        t = _make_tracker()
+        t.sync_from_local([])
+        t._worksheet.append_rows.assert_not_called()
+
 
 # ── revoke ────────────────────────────────────────────────────────────────────
 
@@ -321,13 +368,11 @@ class TestRevoke:
 class TestSheetsSyncManager:
 
     def test_get_tracker_returns_none_when_local_mode(self):
-        from integrations import sheets_sync_manager
         with patch("integrations.sheets_sync_manager.config_manager.load",
                    return_value={"tracker": {"mode": "local"}}):
             assert sheets_sync_manager.get_tracker() is None
 
     def test_get_tracker_returns_none_when_not_authenticated(self):
-        from integrations import sheets_sync_manager
         with patch("integrations.sheets_sync_manager.config_manager.load",
                    return_value={"tracker": {"mode": "google"}}):
             with patch("integrations.sheets_sync_manager.GoogleSheetsTracker") as MockTracker:
@@ -336,25 +381,21 @@ class TestSheetsSyncManager:
                 assert result is None
 
     def test_push_new_application_returns_false_without_tracker(self):
-        from integrations import sheets_sync_manager
         with patch("integrations.sheets_sync_manager.get_tracker", return_value=None):
             assert sheets_sync_manager.push_new_application(1) is False
 
     def test_push_status_update_returns_false_without_tracker(self):
-        from integrations import sheets_sync_manager
         with patch("integrations.sheets_sync_manager.get_tracker", return_value=None):
             result = sheets_sync_manager.push_status_update(1, "Applied", "2026-01-01")
             assert result is False
 
     def test_full_sync_returns_zeros_without_tracker(self):
-        from integrations import sheets_sync_manager
         with patch("integrations.sheets_sync_manager.get_tracker", return_value=None):
             stats = sheets_sync_manager.full_sync()
             assert stats["appended"] == 0
             assert stats["failed"]   == 0
 
     def test_full_sync_calls_sync_from_local(self):
-        from integrations import sheets_sync_manager
         mock_tracker = MagicMock()
         mock_tracker.sync_from_local.return_value = {"appended":2,"updated":0,"skipped":1}
         with patch("integrations.sheets_sync_manager.get_tracker", return_value=mock_tracker):
@@ -365,7 +406,6 @@ class TestSheetsSyncManager:
         assert stats["appended"] == 2
 
     def test_push_new_application_calls_append(self):
-        from integrations import sheets_sync_manager
         mock_tracker = MagicMock()
         mock_tracker.append_application.return_value = 3
         mock_tracker._spreadsheet.id = "ss_id"
@@ -5,27 +5,69 @@ Tests for core/job_fetcher.py.
 Uses mocked provider responses to test deduplication and retry logic.
 """
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 from core import job_fetcher
 from core.job_model import JobListing
+from integrations.base_provider import ProviderError
+
+
+def _listing(provider="usajobs", **overrides) -> JobListing:
+    data = dict(
+        job_id=f"{provider}_1", provider=provider,
+        title="SOC Analyst", company="CISA", location="Dallas, TX", state="TX",
+    )
+    data.update(overrides)
+    return JobListing(**data)
+
+
+def _provider(name, results=None, error=None) -> MagicMock:
+    """A stand-in provider whose search() returns results or raises error."""
+    provider = MagicMock()
+    provider.DISPLAY_NAME = name
+    if error is not None:
+        provider.search.side_effect = error
+    else:
+        provider.search.return_value = results or []
+    return provider
+
+
+@pytest.fixture
+def no_retry_delay(monkeypatch):
+    monkeypatch.setattr(job_fetcher, "RETRY_DELAY_SECONDS", 0)
 
 
 def test_deduplication_removes_same_job_from_two_providers():
     """The same job appearing in two provider results should produce one listing."""
-    # TODO: Create two JobListing objects with same dedup_key(), call _deduplicate()
-    # Assert result has length 1
-    raise NotImplementedError
+    a = _listing("usajobs")
+    b = _listing("indeed", title="SOC  Analyst!", company="cisa")
+    assert a.dedup_key() == b.dedup_key()
+    assert len(job_fetcher._deduplicate([a, b])) == 1
+
+
+def test_deduplication_keeps_highest_quality_listing_even_when_last():
+    """Among duplicates, the most complete listing wins regardless of arrival order."""
+    sparse = _listing("usajobs")
+    middle = _listing("indeed", salary_min=90000.0, salary_max=120000.0)
+    best   = _listing("adzuna", description="Monitor SIEM alerts.", salary_min=95000.0)
+    assert sparse.dedup_key() == middle.dedup_key() == best.dedup_key()
+    assert job_fetcher._deduplicate([sparse, middle, best]) == [best]
 
 
-def test_retry_logic_calls_provider_up_to_max_retries(monkeypatch):
+def test_retry_logic_calls_provider_up_to_max_retries(monkeypatch, no_retry_delay):
     """A failing provider should be retried MAX_RETRIES times then skipped."""
-    # TODO: Mock a provider that always raises ProviderError
-    # Run fetch_jobs(), assert provider was called exactly MAX_RETRIES times
-    raise NotImplementedError
+    failing = _provider("Indeed", error=ProviderError("indeed", "rate limited", 429))
+    monkeypatch.setattr(job_fetcher, "_get_enabled_providers", lambda cfg: [failing])
 
+    assert job_fetcher.fetch_jobs({}) == []
+    assert failing.search.call_count == job_fetcher.MAX_RETRIES
 
-def test_one_failing_provider_doesnt_stop_others(monkeypatch):
+
+def test_one_failing_provider_doesnt_stop_others(monkeypatch, no_retry_delay):
     """If one provider fails all retries, other providers still return results."""
-    # TODO: Mock one failing provider and one successful provider
-    # Assert results from the successful provider are returned
-    raise NotImplementedError
+    listing = _listing("usajobs")
+    failing = _provider("Indeed", error=ProviderError("indeed", "server error", 500))
+    working = _provider("USAJobs", results=[listing])
+    monkeypatch.setattr(job_fetcher, "_get_enabled_providers",
+                        lambda cfg: [failing, working])
+
+    assert job_fetcher.fetch_jobs({}) == [listing]
@@ -6,8 +6,9 @@ Monkeypatches the keyring library to avoid touching the real OS
 credential store during testing.
 """
 
+import keyring
+import keyring.errors
 import pytest
-from unittest.mock import MagicMock, patch
 from core import keyring_manager
 
 
@@ -26,14 +27,13 @@ def mock_keyring(monkeypatch):
         return store.get(service)
 
     def fake_delete(service, username):
-        import keyring.errors
         if service not in store:
             raise keyring.errors.PasswordDeleteError("not found")
         del store[service]
 
-    monkeypatch.setattr("keyring.set_password", fake_set)
-    monkeypatch.setattr("keyring.get_password", fake_get)
-    monkeypatch.setattr("keyring.delete_password", fake_delete)
+    monkeypatch.setattr(keyring, "set_password", fake_set)
+    monkeypatch.setattr(keyring, "get_password", fake_get)
+    monkeypatch.setattr(keyring, "delete_password", fake_delete)
     return store
 
 
@@ -99,45 +99,24 @@ def test_has_key_false_after_delete(mock_keyring):
 
 # ── validate_key_format ───────────────────────────────────────────────────────
 
-def test_validate_empty_key_fails():
-    valid, msg = keyring_manager.validate_key_format("indeed", "")
-    assert valid == False
-    assert "empty" in msg.lower()
-
-
-def test_validate_whitespace_only_fails():
-    valid, msg = keyring_manager.validate_key_format("indeed", "   ")
-    assert valid == False
-
-
-def test_validate_too_short_fails():
-    valid, msg = keyring_manager.validate_key_format("usajobs", "abc")
-    assert valid == False
-    assert "short" in msg.lower()
-
-
-def test_validate_key_with_spaces_fails():
-    valid, msg = keyring_manager.validate_key_format("indeed", "abc 123 def 456 ghi 789 jkl")
-    assert valid == False
-    assert "space" in msg.lower()
-
-
-def test_validate_anthropic_wrong_prefix_fails():
-    valid, msg = keyring_manager.validate_key_format("anthropic", "not-the-right-prefix-12345678")
-    assert valid == False
-    assert "sk-ant-" in msg
-
-
-def test_validate_anthropic_correct_prefix_passes():
-    valid, msg = keyring_manager.validate_key_format("anthropic", "sk-ant-REDACTED")
-    assert valid == True
-    assert msg == ""
-
-
-def test_validate_reasonable_key_passes():
-    valid, msg = keyring_manager.validate_key_format("indeed", "abcdef1234567890abcdef1234567890")
-    assert valid == True
-    assert msg == ""
+@pytest.mark.parametrize("provider,key,expected_valid,expected_msg", [
+    ("indeed",    "",                                  False, "empty"),
+    ("indeed",    "   ",                               False, "empty"),
+    ("usajobs",   "abc",                               False, "short"),
+    ("indeed",    "abc 123 def 456 ghi 789 jkl",       False, "space"),
+    ("anthropic", "not-the-right-prefix-1234567890",   False, "sk-ant-"),
+    ("anthropic", "sk-ant-REDACTED",   True,  ""),
+    ("indeed",    "abcdef1234567890abcdef1234567890",  True,  ""),
+], ids=["empty", "whitespace_only", "too_short", "inner_spaces",
+        "anthropic_wrong_prefix", "anthropic_correct_prefix", "reasonable_key"])
+def test_validate_key_format(provider, key, expected_valid, expected_msg):
+    """validate_key_format is pure — no keyring access, so no fixture needed."""
+    valid, msg = keyring_manager.validate_key_format(provider, key)
+    assert valid == expected_valid
+    if expected_valid:
+        assert msg == ""
+    else:
+        assert expected_msg in msg.lower()
 
 
 def test_validate_service_name_format():
@@ -2,11 +2,17 @@
 tests/test_map_builder.py
 ==========================
 Tests for core/map_builder.py and core/commute_calculator.py.
-No network calls, no Folium rendering, no ORS API — all mocked.
+No network calls and no ORS API — all mocked. Folium rendering is real
+but done once per session where tests only inspect the HTML.
 """
 
+import dataclasses
+import os
+import folium
 import pytest
-from unittest.mock import MagicMock, patch
+import requests
+from pathlib import Path
+from types import SimpleNamespace
 from core.job_model import JobListing
 from core.map_builder import _commute_color, _build_popup_html, build_map
 from core import commute_calculator
@@ -14,357 +20,399 @@ from core import commute_calculator
 
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
+# Home (Forney, TX) and the default job's location (Dallas, TX)
+_HOME_LAT, _HOME_LON = 32.7459, -96.4685
+_DEST_LAT, _DEST_LON = 32.7767, -96.7970
+
+_JOB_DEFAULTS = dict(
+    job_id="test_001", provider="usajobs",
+    title="SOC Analyst", company="CISA",
+    location="Dallas, TX", city="Dallas", state="TX",
+    latitude=_DEST_LAT, longitude=_DEST_LON,
+    is_remote=False, is_hybrid=False,
+    salary_min=75000.0, salary_max=95000.0,
+    salary_interval="annual",
+    url="https://usajobs.gov/1",
+    commute_minutes=None,
+)
+_PROTO = JobListing(**_JOB_DEFAULTS)
+
+
 def _job(**kw) -> JobListing:
-    defaults = dict(
-        job_id="test_001", provider="usajobs",
-        title="SOC Analyst", company="CISA",
-        location="Dallas, TX", city="Dallas", state="TX",
-        latitude=32.7767, longitude=-96.7970,
-        is_remote=False, is_hybrid=False,
-        salary_min=75000.0, salary_max=95000.0,
-        salary_interval="annual",
-        url="https://usajobs.gov/1",
-        commute_minutes=None,
-    )
-    defaults.update(kw)
-    return JobListing(**defaults)
+    # Always a copy: calculate_batch writes commute_minutes onto listings,
+    # so handing out the shared prototype would leak state between tests.
+    return dataclasses.replace(_PROTO, **kw)
 
 
 # ── _commute_color ────────────────────────────────────────────────────────────
 
-class TestCommuteColor:
+@pytest.mark.parametrize("minutes,expected", [
+    (None, "gray"),
+    (0,    "green"),
+    (15,   "green"),
+    (29,   "green"),    # boundary: last green minute
+    (30,   "orange"),   # boundary: 30 is orange, not green
+    (45,   "orange"),
+    (60,   "orange"),   # boundary: 60 is orange, not red
+    (61,   "red"),
+    (90,   "red"),
+    (120,  "red"),
+])
+def test_commute_color(minutes, expected):
+    assert _commute_color(minutes) == expected
 
-    def test_none_returns_gray(self):
-        assert _commute_color(None) == "gray"
 
-    def test_under_30_returns_green(self):
-        assert _commute_color(0)  == "green"
-        assert _commute_color(15) == "green"
-        assert _commute_color(29) == "green"
+# ── _build_popup_html ─────────────────────────────────────────────────────────
 
-    def test_30_to_60_returns_orange(self):
-        assert _commute_color(30) == "orange"
-        assert _commute_color(45) == "orange"
-        assert _commute_color(60) == "orange"
+# (job overrides, substrings that must appear, substrings that must not)
+_POPUP_CASES = {
+    "title":             (dict(title="SOC Analyst"),      ["SOC Analyst"], []),
+    "company":           (dict(company="CISA"),           ["CISA"], []),
+    "location":          (dict(location="Dallas, TX"),    ["Dallas, TX"], []),
+    "commute_minutes":   (dict(commute_minutes=25),       ["25 min"], []),
+    "commute_hours":     (dict(commute_minutes=90),       ["1h", "30min"], []),
+    "commute_unknown":   (dict(commute_minutes=None),     ["not calculated"], []),
+    "remote_badge":      (dict(is_remote=True),           ["Remote"], []),
+    "hybrid_badge":      (dict(is_hybrid=True),           ["Hybrid"], []),
+    "onsite_no_badge":   (dict(is_remote=False, is_hybrid=False), [], ["Remote", "Hybrid"]),
+    "apply_link":        (dict(url="https://usajobs.gov/123"), ["https://usajobs.gov/123"], []),
+    "no_apply_link":     (dict(url=""),                   [], ["View Posting"]),
+    "salary":            (dict(salary_min=75000.0, salary_max=95000.0), ["75,000"], []),
+}
 
-    def test_over_60_returns_red(self):
-        assert _commute_color(61)  == "red"
-        assert _commute_color(90)  == "red"
-        assert _commute_color(120) == "red"
 
-    def test_boundary_30_is_orange_not_green(self):
-        assert _commute_color(30) == "orange"
-        assert _commute_color(29) == "green"
+@pytest.mark.parametrize("kw,must,must_not", list(_POPUP_CASES.values()),
+                         ids=list(_POPUP_CASES))
+def test_popup_html(kw, must, must_not):
+    html_lc = _build_popup_html(_job(**kw)).lower()
+    missing = [s for s in must if s.lower() not in html_lc]
+    present_bad = [s for s in must_not if s.lower() in html_lc]
+    assert not missing and not present_bad, (missing, present_bad)
 
-    def test_boundary_60_is_orange_not_red(self):
-        assert _commute_color(60) == "orange"
-        assert _commute_color(61) == "red"
 
+def test_popup_html_returns_string():
+    assert isinstance(_build_popup_html(_job()), str)
 
-# ── _build_popup_html ─────────────────────────────────────────────────────────
 
-class TestBuildPopupHtml:
+# ── build_map ─────────────────────────────────────────────────────────────────
 
-    def test_title_in_popup(self):
-        html = _build_popup_html(_job(title="SOC Analyst"))
-        assert "SOC Analyst" in html
+@pytest.fixture(scope="session")
+def maps_dir(tmp_path_factory):
+    """One output directory for every map written in the session."""
+    return tmp_path_factory.mktemp("maps")
+
+
+@pytest.fixture
+def map_out(maps_dir, request) -> str:
+    """Per-test HTML path inside maps_dir, named after the test."""
+    return str(maps_dir / f"{request.node.name}.html")
+
+
+@pytest.fixture(scope="session")
+def rendered_map(maps_dir):
+    """
+    Render one map for the whole session and share its HTML.
+    Folium/Jinja rendering dominates this file's runtime, and the content
+    checks below only need a single representative map.
+
+    Returns:
+        (output_path, html_bytes) — the content checks are plain byte
+        substring tests, so the file is never decoded.
+    """
+    out = str(maps_dir / "rendered_map.html")
+    build_map(
+        listings=[
+            _job(),
+            _job(job_id="c", title="Cyber Analyst"),
+            _job(job_id="g", commute_minutes=20),
+        ],
+        home_lat=_HOME_LAT, home_lon=_HOME_LON,
+        output_path=out,
+    )
+    return out, Path(out).read_bytes()
+
+
+@pytest.fixture
+def stub_folium_save(monkeypatch):
+    """
+    Skip Folium's HTML render (about 60% of build_map's time when
+    profiled) for tests that check build_map's own logic, not its output.
+    A placeholder file is still written so the path exists.
+    """
+    def _save(self, outfile, **kwargs):
+        with open(outfile, "w", encoding="utf-8") as f:
+            f.write("<html></html>")
+    monkeypatch.setattr(folium.Map, "save", _save)
+
+
+def test_returns_output_path(map_out, stub_folium_save):
+    result = build_map(
+        listings=[_job()],
+        home_lat=_HOME_LAT, home_lon=_HOME_LON,
+        output_path=map_out,
+    )
+    assert result == map_out
 
-    def test_company_in_popup(self):
-        html = _build_popup_html(_job(company="CISA"))
-        assert "CISA" in html
 
-    def test_location_in_popup(self):
-        html = _build_popup_html(_job(location="Dallas, TX"))
-        assert "Dallas, TX" in html
+@pytest.mark.folium
+def test_creates_html_file(rendered_map):
+    out, _ = rendered_map
+    assert os.path.exists(out)
 
-    def test_commute_time_shown_when_available(self):
-        html = _build_popup_html(_job(commute_minutes=25))
-        assert "25 min" in html
 
-    def test_commute_hours_and_mins_formatted(self):
-        html = _build_popup_html(_job(commute_minutes=90))
-        assert "1h" in html and "30min" in html
+@pytest.mark.folium
+def test_html_file_not_empty(rendered_map):
+    _, content = rendered_map
+    assert len(content) > 100
 
-    def test_commute_unknown_when_none(self):
-        html = _build_popup_html(_job(commute_minutes=None))
-        assert "not calculated" in html.lower()
 
-    def test_remote_badge_shown(self):
-        html = _build_popup_html(_job(is_remote=True))
-        assert "Remote" in html
+@pytest.mark.folium
+def test_html_contains_leaflet(rendered_map):
+    """Folium maps always include Leaflet.js."""
+    _, content = rendered_map
+    assert b"leaflet" in content.lower()
 
-    def test_hybrid_badge_shown(self):
-        html = _build_popup_html(_job(is_hybrid=True))
-        assert "Hybrid" in html
 
-    def test_no_badge_for_onsite(self):
-        html = _build_popup_html(_job(is_remote=False, is_hybrid=False))
-        assert "Remote" not in html
-        assert "Hybrid" not in html
+@pytest.mark.folium
+def test_html_contains_job_title(rendered_map):
+    _, content = rendered_map
+    assert b"Cyber Analyst" in content
 
-    def test_apply_link_present_when_url_set(self):
-        html = _build_popup_html(_job(url="https://usajobs.gov/123"))
-        assert "https://usajobs.gov/123" in html
 
-    def test_no_apply_link_when_no_url(self):
-        html = _build_popup_html(_job(url=""))
-        assert "View Posting" not in html
+def test_skips_jobs_without_coords(map_out, stub_folium_save):
+    """Jobs with no coords should not crash map generation."""
+    jobs = [
+        _job(job_id="a", latitude=_DEST_LAT, longitude=_DEST_LON),
+        _job(job_id="b", latitude=None, longitude=None),
+    ]
+    result = build_map(jobs, _HOME_LAT, _HOME_LON, map_out)
+    assert result == map_out  # No crash
 
-    def test_salary_included(self):
-        html = _build_popup_html(_job(salary_min=75000.0, salary_max=95000.0))
-        assert "75,000" in html
 
-    def test_returns_string(self):
-        assert isinstance(_build_popup_html(_job()), str)
+@pytest.mark.folium
+def test_empty_listings_still_generates_map(map_out):
+    """Empty results list should still produce a valid map."""
+    result = build_map([], _HOME_LAT, _HOME_LON, map_out)
+    assert result == map_out
+    assert b"leaflet" in Path(map_out).read_bytes().lower()
 
 
-# ── build_map ─────────────────────────────────────────────────────────────────
+@pytest.mark.folium
+def test_legend_in_map(rendered_map):
+    _, content = rendered_map
+    assert b"Commute Time" in content
+
 
-class TestBuildMap:
-
-    def test_returns_output_path(self, tmp_path):
-        out = str(tmp_path / "test_map.html")
-        result = build_map(
-            listings=[_job()],
-            home_lat=32.7459, home_lon=-96.4685,
-            output_path=out,
-        )
-        assert result == out
-
-    def test_creates_html_file(self, tmp_path):
-        out = str(tmp_path / "test_map.html")
-        build_map(
-            listings=[_job()],
-            home_lat=32.7459, home_lon=-96.4685,
-            output_path=out,
-        )
-        import os
-        assert os.path.exists(out)
-
-    def test_html_file_not_empty(self, tmp_path):
-        out = str(tmp_path / "test_map.html")
-        build_map(
-            listings=[_job()],
-            home_lat=32.7459, home_lon=-96.4685,
-            output_path=out,
-        )
-        content = open(out).read()
-        assert len(content) > 100
-
-    def test_html_contains_leaflet(self, tmp_path):
-        """Folium maps always include Leaflet.js."""
-        out = str(tmp_path / "test_map.html")
-        build_map(listings=[_job()], home_lat=32.7459,
-                  home_lon=-96.4685, output_path=out)
-        assert "leaflet" in open(out).read().lower()
-
-    def test_html_contains_job_title(self, tmp_path):
-        out = str(tmp_path / "test_map.html")
-        build_map(listings=[_job(title="Cyber Analyst")],
-                  home_lat=32.7459, home_lon=-96.4685, output_path=out)
-        assert "Cyber Analyst" in open(out).read()
-
-    def test_skips_jobs_without_coords(self, tmp_path):
-        """Jobs with no coords should not crash map generation."""
-        jobs = [
-            _job(job_id="a", latitude=32.7767, longitude=-96.7970),
-            _job(job_id="b", latitude=None, longitude=None),
-        ]
-        out = str(tmp_path / "test_map.html")
-        result = build_map(jobs, 32.7459, -96.4685, out)
-        assert result == out  # No crash
-
-    def test_empty_listings_still_generates_map(self, tmp_path):
-        """Empty results list should still produce a valid map."""
-        out = str(tmp_path / "test_map.html")
-        result = build_map([], 32.7459, -96.4685, out)
-        assert result == out
-        assert "leaflet" in open(out).read().lower()
-
-    def test_legend_in_map(self, tmp_path):
-        out = str(tmp_path / "test_map.html")
-        build_map(listings=[_job()], home_lat=32.7459,
-                  home_lon=-96.4685, output_path=out)
-        content = open(out).read()
-        assert "Commute Time" in content
-
-    def test_commute_color_reflected_in_map(self, tmp_path):
-        """A job with commute < 30 min should have green pin."""
-        out = str(tmp_path / "test_map.html")
-        build_map(listings=[_job(commute_minutes=20)],
-                  home_lat=32.7459, home_lon=-96.4685, output_path=out)
-        assert "green" in open(out).read()
+@pytest.mark.folium
+def test_commute_color_reflected_in_map(rendered_map):
+    """A job with commute < 30 min should have green pin."""
+    _, content = rendered_map
+    # The legend always says "green"; look for the marker's own option
+    assert b'"color": "green"' in content
 
 
 # ── commute_calculator: _commute_color ───────────────────────────────────────
-# (Also tested in TestCommuteColor above via map_builder import)
-
-class TestCommuteCalculatorCache:
-
-    def setup_method(self):
-        """Clear the in-memory cache before each test."""
-        commute_calculator.clear_cache()
-
-    def test_clear_cache_empties_store(self):
-        commute_calculator._cache[(1.0, 2.0, 3.0, 4.0)] = 25
-        commute_calculator.clear_cache()
-        assert len(commute_calculator._cache) == 0
-
-    def test_cache_populated_after_calculate_single(self):
-        """calculate_single should populate _cache after an API call."""
-        with patch("core.commute_calculator._call_api") as mock_api:
-            with patch("core.commute_calculator.keyring_manager.get_key", return_value="test-key"):
-                mock_api.return_value = [22]
-                result = commute_calculator.calculate_single(
-                    32.7459, -96.4685, 32.7767, -96.7970)
-                assert result == 22
-                cache_key = (32.7459, -96.4685, 32.7767, -96.7970)
-                assert cache_key in commute_calculator._cache
-
-    def test_cache_hit_skips_api_call(self):
-        """Second call with same coords should use cache, not API."""
-        commute_calculator._cache[(32.7459, -96.4685, 32.7767, -96.7970)] = 19
-
-        with patch("core.commute_calculator._call_api") as mock_api:
-            result = commute_calculator.calculate_single(
-                32.7459, -96.4685, 32.7767, -96.7970)
-            assert result == 19
-            mock_api.assert_not_called()
-
-    def test_calculate_single_returns_none_on_error(self):
-        """API failure should return None, not raise."""
-        with patch("core.commute_calculator._call_api",
-                   side_effect=Exception("Network error")):
-            with patch("core.commute_calculator.keyring_manager.get_key", return_value="key"):
-                result = commute_calculator.calculate_single(
-                    32.7459, -96.4685, 32.7767, -96.7970)
-                assert result is None
-
-
-class TestCalculateBatch:
-
-    def setup_method(self):
-        commute_calculator.clear_cache()
-
-    def test_batch_skips_jobs_without_coords(self):
-        """Jobs without coordinates should be skipped silently."""
-        jobs = [_job(job_id="no_loc", latitude=None, longitude=None)]
-        with patch("core.commute_calculator._call_api") as mock_api:
-            with patch("core.commute_calculator._load_db_cache", return_value=jobs):
-                with patch("core.commute_calculator._save_db_cache"):
-                    result = commute_calculator.calculate_batch(
-                        32.7459, -96.4685, jobs)
-                    mock_api.assert_not_called()
-                    assert result[0].commute_minutes is None
-
-    def test_batch_uses_cache_for_known_jobs(self):
-        """Jobs already in cache should not trigger an API call."""
-        job = _job(latitude=32.7767, longitude=-96.7970)
-        commute_calculator._cache[(32.7459, -96.4685, 32.7767, -96.7970)] = 19
-
-        with patch("core.commute_calculator._call_api") as mock_api:
-            commute_calculator.calculate_batch(32.7459, -96.4685, [job])
-            mock_api.assert_not_called()
-        assert job.commute_minutes == 19
-
-    def test_batch_calls_progress_callback(self):
-        """progress_callback should be called for each completed job."""
-        job = _job(latitude=32.7767, longitude=-96.7970)
-        commute_calculator._cache[(32.7459, -96.4685, 32.7767, -96.7970)] = 19
-
-        calls = []
-        commute_calculator.calculate_batch(
-            32.7459, -96.4685, [job],
-            progress_callback=lambda done, total: calls.append((done, total)))
-        assert len(calls) == 1
-        assert calls[0] == (1, 1)
-
-    def test_batch_returns_listings(self):
-        """calculate_batch should return the listings list."""
-        jobs = [_job()]
-        commute_calculator._cache[(32.7459, -96.4685, 32.7767, -96.7970)] = 25
-        result = commute_calculator.calculate_batch(32.7459, -96.4685, jobs)
-        assert result is jobs  # Same list returned
+# (Also tested in test_commute_color above via map_builder import)
+
+def _fake_call_api_factory(ret):
+    """Stand-in for _call_api that returns ret and records each call."""
+    def _fake(*args, **kwargs):
+        _fake.calls.append(args)
+        return ret
+    _fake.calls = []
+    return _fake
+
+
+class _FakeResp:
+    """Minimal stand-in for requests.Response as used by _call_api."""
+    __slots__ = ("status_code", "_json")
+
+    def __init__(self, status: int, payload: dict):
+        self.status_code = status
+        self._json = payload
+
+    def json(self) -> dict:
+        return self._json
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise requests.HTTPError()
+
+
+# The cache key most commute tests seed or expect
+_CACHE_KEY = (_HOME_LAT, _HOME_LON, _DEST_LAT, _DEST_LON)
+
+
+@pytest.fixture(autouse=True)
+def _clean_cache():
+    """Every test starts and ends with an empty in-memory commute cache."""
+    commute_calculator.clear_cache()
+    yield
+    commute_calculator.clear_cache()
+
+
+@pytest.fixture
+def seeded():
+    """Call seeded(minutes) to pre-cache the home → Dallas commute."""
+    def _seed(minutes):
+        commute_calculator._cache[_CACHE_KEY] = minutes
+    return _seed
+
+
+def test_clear_cache_empties_store():
+    commute_calculator._cache[(1.0, 2.0, 3.0, 4.0)] = 25
+    commute_calculator.clear_cache()
+    assert len(commute_calculator._cache) == 0
+
+
+def test_cache_populated_after_calculate_single(monkeypatch):
+    """calculate_single should populate _cache after an API call."""
+    monkeypatch.setattr(commute_calculator, "_call_api", lambda *a, **k: [22])
+    monkeypatch.setattr(commute_calculator.keyring_manager, "get_key",
+                        lambda *a, **k: "test-key")
+    result = commute_calculator.calculate_single(*_CACHE_KEY)
+    assert result == 22
+    assert _CACHE_KEY in commute_calculator._cache
+
+
+def test_cache_hit_skips_api_call(monkeypatch, seeded):
+    """Second call with same coords should use cache, not API."""
+    seeded(19)
+    fake_api = _fake_call_api_factory([0])
+    monkeypatch.setattr(commute_calculator, "_call_api", fake_api)
+
+    result = commute_calculator.calculate_single(*_CACHE_KEY)
+    assert result == 19
+    assert fake_api.calls == []
+
+
+def test_calculate_single_returns_none_on_error(monkeypatch):
+    """API failure should return None, not raise."""
+    def _raise(*a, **k):
+        raise Exception("Network error")
+    monkeypatch.setattr(commute_calculator, "_call_api", _raise)
+    monkeypatch.setattr(commute_calculator.keyring_manager, "get_key",
+                        lambda *a, **k: "key")
+    result = commute_calculator.calculate_single(*_CACHE_KEY)
+    assert result is None
+
+
+def test_batch_skips_jobs_without_coords(monkeypatch):
+    """Jobs without coordinates should be skipped silently."""
+    jobs = [_job(job_id="no_loc", latitude=None, longitude=None)]
+    fake_api = _fake_call_api_factory([])
+    monkeypatch.setattr(commute_calculator, "_call_api", fake_api)
+    monkeypatch.setattr(commute_calculator, "_load_db_cache", lambda *a, **k: jobs)
+    monkeypatch.setattr(commute_calculator, "_save_db_cache", lambda *a, **k: None)
+    result = commute_calculator.calculate_batch(_HOME_LAT, _HOME_LON, jobs)
+    assert fake_api.calls == []
+    assert result[0].commute_minutes is None
+
+
+def test_batch_uses_cache_for_known_jobs(monkeypatch, seeded):
+    """Jobs already in cache should not trigger an API call."""
+    job = _job(latitude=_DEST_LAT, longitude=_DEST_LON)
+    seeded(19)
+    fake_api = _fake_call_api_factory([])
+    monkeypatch.setattr(commute_calculator, "_call_api", fake_api)
+
+    commute_calculator.calculate_batch(_HOME_LAT, _HOME_LON, [job])
+    assert fake_api.calls == []
+    assert job.commute_minutes == 19
+
+
+def test_batch_calls_progress_callback(seeded):
+    """progress_callback should be called for each completed job."""
+    job = _job(latitude=_DEST_LAT, longitude=_DEST_LON)
+    seeded(19)
+
+    calls = []
+    commute_calculator.calculate_batch(
+        _HOME_LAT, _HOME_LON, [job],
+        progress_callback=lambda done, total: calls.append((done, total)))
+    assert len(calls) == 1
+    assert calls[0] == (1, 1)
+
+
+def test_batch_returns_listings(seeded):
+    """calculate_batch should return the listings list."""
+    jobs = [_job()]
+    seeded(25)
+    result = commute_calculator.calculate_batch(_HOME_LAT, _HOME_LON, jobs)
+    assert result is jobs  # Same list returned
 
 
 # ── _call_api parsing ─────────────────────────────────────────────────────────
 
-class TestCallApi:
-
-    def test_converts_seconds_to_minutes(self):
-        """ORS returns seconds; result should be in minutes."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "durations": [[0, 1140, 2700]]  # 19 min, 45 min (in seconds)
-        }
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("core.commute_calculator.requests.post",
-                   return_value=mock_response):
-            with patch("core.commute_calculator.keyring_manager.get_key",
-                       return_value="test-ors-key"):
-                result = commute_calculator._call_api(
-                    32.7459, -96.4685,
-                    [(32.7767, -96.7970), (32.8998, -97.0641)],
-                )
-        assert result[0] == 19   # 1140s / 60 = 19
-        assert result[1] == 45   # 2700s / 60 = 45
-
-    def test_none_returned_for_unreachable_destination(self):
-        """ORS returns null for destinations it can't route to."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "durations": [[0, None]]
-        }
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("core.commute_calculator.requests.post",
-                   return_value=mock_response):
-            with patch("core.commute_calculator.keyring_manager.get_key",
-                       return_value="test-key"):
-                result = commute_calculator._call_api(
-                    32.7459, -96.4685, [(99.0, 99.0)])
-        assert result[0] is None
-
-    def test_raises_on_missing_api_key(self):
-        """Should raise ValueError if no ORS key is in keyring."""
-        with patch("core.commute_calculator.keyring_manager.get_key",
-                   return_value=None):
-            with pytest.raises(ValueError, match="API key not set"):
-                commute_calculator._call_api(32.7, -96.4, [(32.8, -96.5)])
-
-    def test_raises_on_401(self):
-        """Should raise HTTPError on 401 response."""
-        mock_response = MagicMock()
-        mock_response.status_code = 401
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("core.commute_calculator.requests.post",
-                   return_value=mock_response):
-            with patch("core.commute_calculator.keyring_manager.get_key",
-                       return_value="bad-key"):
-                import requests
-                with pytest.raises(requests.HTTPError):
-                    commute_calculator._call_api(32.7, -96.4, [(32.8, -96.5)])
-
-    def test_lon_lat_order_sent_to_ors(self):
-        """ORS expects [longitude, latitude], not [latitude, longitude]."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"durations": [[0, 600]]}
-        mock_response.raise_for_status = MagicMock()
-
-        with patch("core.commute_calculator.requests.post",
-                   return_value=mock_response) as mock_post:
-            with patch("core.commute_calculator.keyring_manager.get_key",
-                       return_value="key"):
-                commute_calculator._call_api(32.7459, -96.4685, [(32.7767, -96.7970)])
-
-        payload = mock_post.call_args.kwargs["json"]
-        origin = payload["locations"][0]
-        dest   = payload["locations"][1]
-        # Lon first, lat second
-        assert origin == [-96.4685, 32.7459]
-        assert dest   == [-96.7970, 32.7767]
+def test_converts_seconds_to_minutes(monkeypatch):
+    """ORS returns seconds; result should be in minutes."""
+    # 19 min, 45 min (in seconds)
+    resp = SimpleNamespace(status_code=200,
+                           json=lambda: {"durations": [[0, 1140, 2700]]},
+                           raise_for_status=lambda: None)
+    monkeypatch.setattr(commute_calculator.requests, "post",
+                        lambda *a, **k: resp)
+    monkeypatch.setattr(commute_calculator.keyring_manager, "get_key",
+                        lambda *a, **k: "test-ors-key")
+
+    result = commute_calculator._call_api(
+        _HOME_LAT, _HOME_LON,
+        [(_DEST_LAT, _DEST_LON), (32.8998, -97.0641)],
+    )
+    assert result[0] == 19   # 1140s / 60 = 19
+    assert result[1] == 45   # 2700s / 60 = 45
+
+
+def test_none_returned_for_unreachable_destination(monkeypatch):
+    """ORS returns null for destinations it can't route to."""
+    resp = SimpleNamespace(status_code=200,
+                           json=lambda: {"durations": [[0, None]]},
+                           raise_for_status=lambda: None)
+    monkeypatch.setattr(commute_calculator.requests, "post",
+                        lambda *a, **k: resp)
+    monkeypatch.setattr(commute_calculator.keyring_manager, "get_key",
+                        lambda *a, **k: "test-key")
+
+    result = commute_calculator._call_api(
+        _HOME_LAT, _HOME_LON, [(99.0, 99.0)])
+    assert result[0] is None
+
+
+def test_raises_on_missing_api_key(monkeypatch):
+    """Should raise ValueError if no ORS key is in keyring."""
+    monkeypatch.setattr(commute_calculator.keyring_manager, "get_key",
+                        lambda *a, **k: None)
+    with pytest.raises(ValueError, match="API key not set"):
+        commute_calculator._call_api(32.7, -96.4, [(32.8, -96.5)])
+
+
+def test_raises_on_401(monkeypatch):
+    """Should raise HTTPError on 401 response."""
+    monkeypatch.setattr(commute_calculator.requests, "post",
+                        lambda *a, **k: _FakeResp(401, {}))
+    monkeypatch.setattr(commute_calculator.keyring_manager, "get_key",
+                        lambda *a, **k: "bad-key")
+    with pytest.raises(requests.HTTPError):
+        commute_calculator._call_api(32.7, -96.4, [(32.8, -96.5)])
+
+
+def test_lon_lat_order_sent_to_ors(monkeypatch):
+    """ORS expects [longitude, latitude], not [latitude, longitude]."""
+    captured = {}
+
+    def _post(*a, **k):
+        captured.update(k)
+        return _FakeResp(200, {"durations": [[0, 600]]})
+
+    monkeypatch.setattr(commute_calculator.requests, "post", _post)
+    monkeypatch.setattr(commute_calculator.keyring_manager, "get_key",
+                        lambda *a, **k: "key")
+
+    commute_calculator._call_api(_HOME_LAT, _HOME_LON, [(_DEST_LAT, _DEST_LON)])
+
+    payload = captured["json"]
+    origin = payload["locations"][0]
+    dest   = payload["locations"][1]
+    # Lon first, lat second
+    assert origin == [_HOME_LON, _HOME_LAT]
+    assert dest   == [_DEST_LON, _DEST_LAT]
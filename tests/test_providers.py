@@ -2,298 +2,243 @@
 tests/test_providers.py
 ========================
 Tests for Phase 12 providers: Indeed, LinkedIn, Glassdoor, Adzuna.
-No network calls — all requests.get/post are mocked.
+No network calls — BaseProvider._http_get is stubbed for every test.
+
+Every test is hermetic: shared fixtures are read-only and _http_get is
+monkeypatched per test, so the file needs no xdist_group and its tests
+spread freely across workers (pytest tests/test_providers.py -n auto).
 """
 
 import pytest
+import requests
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from types import MappingProxyType
+from typing import Mapping, Sequence
+from unittest.mock import MagicMock
 
 from core.job_model import JobListing
-from integrations.base_provider import ProviderError
+from integrations.adzuna_provider import AdzunaProvider
+from integrations.base_provider import BaseProvider, ProviderError
+from integrations.glassdoor_provider import GlassdoorProvider
+from integrations.indeed_provider import IndeedProvider
+from integrations.linkedin_provider import LinkedInProvider
 
 
 # ── Shared mock response builder ──────────────────────────────────────────────
 
-def _jsearch_response(jobs: list, status: int = 200) -> MagicMock:
-    r = MagicMock()
-    r.status_code = status
-    r.ok = (status == 200)
-    r.json.return_value = {"data": jobs}
-    r.raise_for_status = MagicMock()
-    return r
-
-def _adzuna_response(jobs: list, status: int = 200) -> MagicMock:
-    r = MagicMock()
-    r.status_code = status
-    r.ok = (status == 200)
-    r.json.return_value = {"results": jobs, "count": len(jobs)}
-    r.raise_for_status = MagicMock()
-    return r
-
-def _jsearch_job(**kw) -> dict:
-    defaults = {
-        "job_id": "abc123",
-        "job_title": "SOC Analyst",
-        "employer_name": "CISA",
-        "job_city": "Dallas",
-        "job_state": "TX",
-        "job_apply_link": "https://jobs.example.com/1",
-        "job_description": "Monitor security events and respond to incidents.",
-        "job_is_remote": False,
-        "job_min_salary": 70000,
-        "job_max_salary": 95000,
-        "job_salary_period": "YEAR",
-        "job_posted_at_datetime_utc": "2026-02-01T12:00:00Z",
-        "job_publisher": "Indeed",
-    }
-    defaults.update(kw)
-    return defaults
-
-def _adzuna_job(**kw) -> dict:
-    defaults = {
-        "id": "az_001",
-        "title": "Security Analyst",
-        "company": {"display_name": "Lockheed Martin"},
-        "location": {"display_name": "Fort Worth, TX", "area": ["TX", "Fort Worth"]},
-        "redirect_url": "https://www.adzuna.com/details/az_001",
-        "description": "Perform security monitoring and threat hunting.",
-        "salary_min": 65000,
-        "salary_max": 90000,
-        "created": "2026-02-10T08:00:00Z",
-        "category": {"label": "IT Jobs"},
-    }
-    defaults.update(kw)
-    return defaults
+class _FakeResp:
+    """Minimal stand-in for requests.Response as read by the providers."""
+    __slots__ = ("status_code", "ok", "_payload")
+
+    def __init__(self, payload: dict, status: int = 200):
+        self.status_code = status
+        self.ok = (status == 200)
+        self._payload = payload
+
+    def json(self) -> dict:
+        return self._payload
+
+    def raise_for_status(self) -> None:
+        if not self.ok:
+            raise requests.HTTPError(response=self)
+
+
+def _jsearch_response(jobs: Sequence, status: int = 200) -> _FakeResp:
+    return _FakeResp({"data": jobs}, status)
+
+def _adzuna_response(jobs: Sequence, status: int = 200) -> _FakeResp:
+    return _FakeResp({"results": jobs, "count": len(jobs)}, status)
+
+# Raw payload defaults, built once and read-only. _normalize only reads its
+# input, so a call without overrides hands back the frozen mapping itself.
+# The nested Adzuna dicts are shared too — tests replace them via kwargs.
+_JSEARCH_DEFAULTS = MappingProxyType({
+    "job_id": "abc123",
+    "job_title": "SOC Analyst",
+    "employer_name": "CISA",
+    "job_city": "Dallas",
+    "job_state": "TX",
+    "job_apply_link": "https://jobs.example.com/1",
+    "job_description": "Monitor security events and respond to incidents.",
+    "job_is_remote": False,
+    "job_min_salary": 70000,
+    "job_max_salary": 95000,
+    "job_salary_period": "YEAR",
+    "job_posted_at_datetime_utc": "2026-02-01T12:00:00Z",
+    "job_publisher": "Indeed",
+})
+
+_ADZUNA_DEFAULTS = MappingProxyType({
+    "id": "az_001",
+    "title": "Security Analyst",
+    "company": {"display_name": "Lockheed Martin"},
+    "location": {"display_name": "Fort Worth, TX", "area": ["TX", "Fort Worth"]},
+    "redirect_url": "https://www.adzuna.com/details/az_001",
+    "description": "Perform security monitoring and threat hunting.",
+    "salary_min": 65000,
+    "salary_max": 90000,
+    "created": "2026-02-10T08:00:00Z",
+    "category": {"label": "IT Jobs"},
+})
+
+# The default payloads' posting dates, as _normalize should parse them
+_JSEARCH_POSTED = datetime(2026, 2, 1, 12, 0, tzinfo=timezone.utc)
+_ADZUNA_POSTED  = datetime(2026, 2, 10, 8, 0, tzinfo=timezone.utc)
+
+def _jsearch_job(**kw) -> Mapping:
+    return {**_JSEARCH_DEFAULTS, **kw} if kw else _JSEARCH_DEFAULTS
+
+def _adzuna_job(**kw) -> Mapping:
+    return {**_ADZUNA_DEFAULTS, **kw} if kw else _ADZUNA_DEFAULTS
+
+# Oversized result pages for the max_results tests, built once
+_MANY_JSEARCH = tuple(_jsearch_job(job_id=f"j{i}") for i in range(20))
+_MANY_ADZUNA  = tuple(_adzuna_job(id=str(i)) for i in range(30))
+
+
+# ── Fixtures ──────────────────────────────────────────────────────────────────
+# Providers hold only their API key, and the canned responses are only read,
+# so one instance of each is shared rather than rebuilt per test.
+# Indeed, LinkedIn and Glassdoor all wrap the JSearch API, so one set of
+# tests runs against each of them.
+
+@pytest.fixture(scope="module",
+                params=[IndeedProvider, LinkedInProvider, GlassdoorProvider],
+                ids=["indeed", "linkedin", "glassdoor"])
+def jsearch_provider(request):
+    return request.param(api_key="test-rapidapi-key")
+
+@pytest.fixture(scope="module")
+def adzuna_provider():
+    return AdzunaProvider(api_key="app123:key456")
+
+# _normalize only reads its input, so each provider's result for the
+# default payload is computed once and shared by the assertions on it.
+
+@pytest.fixture(scope="module")
+def jsearch_default_normalized(jsearch_provider):
+    return jsearch_provider._normalize(_jsearch_job())
+
+@pytest.fixture(scope="module")
+def adzuna_default_normalized(adzuna_provider):
+    return adzuna_provider._normalize(_adzuna_job())
+
+@pytest.fixture(autouse=True)
+def http_get(monkeypatch):
+    """
+    Stub BaseProvider._http_get for every provider at once. Tests set
+    http_get.return_value / .side_effect; nothing ever reaches the network.
+    """
+    stub = MagicMock()
+    monkeypatch.setattr(BaseProvider, "_http_get", stub)
+    return stub
+
+@pytest.fixture(scope="session")
+def jsearch_ok():
+    return _jsearch_response([_jsearch_job()])
+
+@pytest.fixture(scope="session")
+def jsearch_401():
+    return _jsearch_response([], 401)
+
+@pytest.fixture(scope="session")
+def jsearch_429():
+    return _jsearch_response([], 429)
+
+@pytest.fixture(scope="session")
+def adzuna_ok():
+    return _adzuna_response([_adzuna_job()])
+
+@pytest.fixture(scope="session")
+def adzuna_401():
+    return _adzuna_response([], 401)
+
+@pytest.fixture(scope="session")
+def adzuna_429():
+    return _adzuna_response([], 429)
 
 
 # ══════════════════════════════════════════════════════════════════════════════
-# IndeedProvider
+# JSearch providers: Indeed, LinkedIn, Glassdoor
 # ══════════════════════════════════════════════════════════════════════════════
 
-class TestIndeedProvider:
-
-    def _provider(self):
-        from integrations.indeed_provider import IndeedProvider
-        return IndeedProvider(api_key="test-rapidapi-key")
-
-    def test_search_returns_list_of_job_listings(self):
-        p = self._provider()
-        mock_resp = _jsearch_response([_jsearch_job()])
-        with patch("integrations.indeed_provider.requests.get", return_value=mock_resp):
-            results = p.search(["SOC Analyst"], "Dallas, TX", 50)
-        assert isinstance(results, list)
+class TestJSearchProvider:
+
+    def test_provider_id(self, jsearch_provider, jsearch_default_normalized):
+        assert jsearch_default_normalized.provider == jsearch_provider.PROVIDER_ID
+
+    def test_job_id_prefixed(self, jsearch_provider):
+        result = jsearch_provider._normalize(_jsearch_job(job_id="xyz789"))
+        assert result.job_id == f"{jsearch_provider.PROVIDER_ID}_xyz789"
+
+    @pytest.mark.parametrize("kw,attr,expected", [
+        ({"job_title": "Threat Hunter"},        "title",            "Threat Hunter"),
+        ({"employer_name": "FBI"},              "company",          "FBI"),
+        ({"job_city": "Dallas", "job_state": "TX"}, "location",     "Dallas, TX"),
+        ({"job_is_remote": True},               "is_remote",        True),
+        ({"job_is_remote": False},              "is_remote",        False),
+        ({"job_posted_at_datetime_utc": "not-a-date"}, "date_posted", None),
+        ({"job_title": "Senior SOC Analyst"},   "experience_level", "senior"),
+        ({"job_title": "Entry Level SOC Analyst"}, "experience_level", "entry"),
+    ], ids=["title", "company", "location", "remote_true", "remote_false",
+            "bad_date", "senior", "entry"])
+    def test_normalize_field(self, jsearch_provider, kw, attr, expected):
+        result = jsearch_provider._normalize(_jsearch_job(**kw))
+        assert getattr(result, attr) == expected
+
+    @pytest.mark.parametrize("lo,hi,period,interval", [
+        (70000, 95000, "YEAR", "annual"),
+        (30,    45,    "HOUR", "hourly"),
+    ], ids=["annual", "hourly"])
+    def test_normalize_salary(self, jsearch_provider, lo, hi, period, interval):
+        result = jsearch_provider._normalize(
+            _jsearch_job(job_min_salary=lo, job_max_salary=hi, job_salary_period=period))
+        assert result.salary_min == float(lo)
+        assert result.salary_max == float(hi)
+        assert result.salary_interval == interval
+
+    def test_date_posted_parsed(self, jsearch_default_normalized):
+        assert jsearch_default_normalized.date_posted == _JSEARCH_POSTED
+
+    def test_search_returns_list_of_job_listings(self, jsearch_provider, jsearch_ok, http_get):
+        http_get.return_value = jsearch_ok
+        results = jsearch_provider.search(["SOC Analyst"], "Dallas, TX", 50)
         assert len(results) == 1
         assert isinstance(results[0], JobListing)
 
-    def test_provider_id_is_indeed(self):
-        result = self._provider()._normalize(_jsearch_job())
-        assert result.provider == "indeed"
-
-    def test_job_id_prefixed_indeed(self):
-        result = self._provider()._normalize(_jsearch_job(job_id="xyz789"))
-        assert result.job_id.startswith("indeed_")
-
-    def test_title_mapped(self):
-        result = self._provider()._normalize(_jsearch_job(job_title="Threat Hunter"))
-        assert result.title == "Threat Hunter"
+    def test_raises_provider_error_on_401(self, jsearch_provider, jsearch_401, http_get):
+        http_get.return_value = jsearch_401
+        with pytest.raises(ProviderError) as exc:
+            jsearch_provider.search(["SOC"], "Dallas", 50)
+        assert exc.value.status_code == 401
 
-    def test_company_mapped(self):
-        result = self._provider()._normalize(_jsearch_job(employer_name="FBI"))
-        assert result.company == "FBI"
+    def test_raises_provider_error_on_429(self, jsearch_provider, jsearch_429, http_get):
+        http_get.return_value = jsearch_429
+        with pytest.raises(ProviderError) as exc:
+            jsearch_provider.search(["SOC"], "Dallas", 50)
+        assert exc.value.status_code == 429
 
-    def test_location_city_state(self):
-        result = self._provider()._normalize(_jsearch_job(job_city="Dallas", job_state="TX"))
-        assert "Dallas" in result.location
-        assert "TX" in result.location
-
-    def test_salary_annual(self):
-        result = self._provider()._normalize(
-            _jsearch_job(job_min_salary=70000, job_max_salary=95000, job_salary_period="YEAR"))
-        assert result.salary_min == 70000.0
-        assert result.salary_max == 95000.0
-        assert result.salary_interval == "annual"
-
-    def test_salary_hourly(self):
-        result = self._provider()._normalize(
-            _jsearch_job(job_min_salary=30, job_max_salary=45, job_salary_period="HOUR"))
-        assert result.salary_interval == "hourly"
-
-    def test_is_remote_true(self):
-        result = self._provider()._normalize(_jsearch_job(job_is_remote=True))
-        assert result.is_remote is True
-
-    def test_is_remote_false(self):
-        result = self._provider()._normalize(_jsearch_job(job_is_remote=False))
-        assert result.is_remote is False
-
-    def test_date_posted_parsed(self):
-        result = self._provider()._normalize(
-            _jsearch_job(job_posted_at_datetime_utc="2026-02-01T12:00:00Z"))
-        assert isinstance(result.date_posted, datetime)
-        assert result.date_posted.year == 2026
-
-    def test_bad_date_does_not_crash(self):
-        result = self._provider()._normalize(
-            _jsearch_job(job_posted_at_datetime_utc="not-a-date"))
-        assert result.date_posted is None
-
-    def test_senior_experience_detected(self):
-        result = self._provider()._normalize(_jsearch_job(job_title="Senior SOC Analyst"))
-        assert result.experience_level == "senior"
-
-    def test_entry_experience_detected(self):
-        result = self._provider()._normalize(_jsearch_job(job_title="Entry Level SOC Analyst"))
-        assert result.experience_level == "entry"
-
-    def test_raises_provider_error_on_401(self):
-        p = self._provider()
-        with patch("integrations.indeed_provider.requests.get",
-                   return_value=_jsearch_response([], 401)):
-            with pytest.raises(ProviderError) as exc:
-                p.search(["SOC"], "Dallas", 50)
-            assert exc.value.status_code == 401
-
-    def test_raises_provider_error_on_429(self):
-        p = self._provider()
-        with patch("integrations.indeed_provider.requests.get",
-                   return_value=_jsearch_response([], 429)):
-            with pytest.raises(ProviderError) as exc:
-                p.search(["SOC"], "Dallas", 50)
-            assert exc.value.status_code == 429
-
-    def test_malformed_result_skipped_not_crashed(self):
-        p = self._provider()
+    def test_malformed_result_skipped_not_crashed(self, jsearch_provider, http_get):
         bad = {"job_id": None, "job_title": None}
-        mock_resp = _jsearch_response([bad, _jsearch_job()])
-        with patch("integrations.indeed_provider.requests.get", return_value=mock_resp):
-            results = p.search(["SOC"], "Dallas", 50)
-        assert len(results) >= 0   # Should not raise
-
-    def test_validate_key_returns_true_on_200(self):
-        p = self._provider()
-        with patch("integrations.indeed_provider.requests.get",
-                   return_value=_jsearch_response([_jsearch_job()])):
-            ok, msg = p.validate_key()
+        http_get.return_value = _jsearch_response([bad, _jsearch_job()])
+        results = jsearch_provider.search(["SOC"], "Dallas", 50)
+        # The bad item may be skipped or kept, but the good one must survive
+        assert any(r.title == "SOC Analyst" for r in results)
+
+    def test_validate_key_returns_true_on_200(self, jsearch_provider, jsearch_ok, http_get):
+        http_get.return_value = jsearch_ok
+        ok, _ = jsearch_provider.validate_key()
         assert ok is True
 
-    def test_validate_key_returns_false_on_401(self):
-        p = self._provider()
-        with patch("integrations.indeed_provider.requests.get",
-                   return_value=_jsearch_response([], 401)):
-            ok, msg = p.validate_key()
+    def test_validate_key_returns_false_on_401(self, jsearch_provider, jsearch_401, http_get):
+        http_get.return_value = jsearch_401
+        ok, _ = jsearch_provider.validate_key()
         assert ok is False
 
-    def test_max_results_respected(self):
-        p = self._provider()
-        jobs = [_jsearch_job(job_id=f"j{i}") for i in range(20)]
-        mock_resp = _jsearch_response(jobs)
-        with patch("integrations.indeed_provider.requests.get", return_value=mock_resp):
-            results = p.search(["SOC"], "Dallas", 50, max_results=5)
-        assert len(results) <= 5
-
-
-# ══════════════════════════════════════════════════════════════════════════════
-# LinkedInProvider
-# ══════════════════════════════════════════════════════════════════════════════
-
-class TestLinkedInProvider:
-
-    def _provider(self):
-        from integrations.linkedin_provider import LinkedInProvider
-        return LinkedInProvider(api_key="test-rapidapi-key")
-
-    def test_returns_job_listings(self):
-        p = self._provider()
-        with patch("integrations.linkedin_provider.requests.get",
-                   return_value=_jsearch_response([_jsearch_job()])):
-            results = p.search(["SOC"], "Dallas, TX", 50)
-        assert isinstance(results, list)
-
-    def test_provider_id_is_linkedin(self):
-        result = self._provider()._normalize(_jsearch_job())
-        assert result.provider == "linkedin"
-
-    def test_job_id_prefixed_linkedin(self):
-        result = self._provider()._normalize(_jsearch_job(job_id="xyz"))
-        assert result.job_id.startswith("linkedin_")
-
-    def test_title_mapped(self):
-        result = self._provider()._normalize(_jsearch_job(job_title="Security Engineer"))
-        assert result.title == "Security Engineer"
-
-    def test_salary_mapped(self):
-        result = self._provider()._normalize(
-            _jsearch_job(job_min_salary=80000, job_max_salary=110000, job_salary_period="YEAR"))
-        assert result.salary_min == 80000.0
-        assert result.salary_interval == "annual"
-
-    def test_raises_on_401(self):
-        p = self._provider()
-        with patch("integrations.linkedin_provider.requests.get",
-                   return_value=_jsearch_response([], 401)):
-            with pytest.raises(ProviderError):
-                p.search(["SOC"], "Dallas", 50)
-
-    def test_validate_key_true_on_200(self):
-        p = self._provider()
-        with patch("integrations.linkedin_provider.requests.get",
-                   return_value=_jsearch_response([_jsearch_job()])):
-            ok, _ = p.validate_key()
-        assert ok is True
-
-    def test_validate_key_false_on_401(self):
-        p = self._provider()
-        with patch("integrations.linkedin_provider.requests.get",
-                   return_value=_jsearch_response([], 401)):
-            ok, _ = p.validate_key()
-        assert ok is False
-
-
-# ══════════════════════════════════════════════════════════════════════════════
-# GlassdoorProvider
-# ══════════════════════════════════════════════════════════════════════════════
-
-class TestGlassdoorProvider:
-
-    def _provider(self):
-        from integrations.glassdoor_provider import GlassdoorProvider
-        return GlassdoorProvider(api_key="test-rapidapi-key")
-
-    def test_returns_job_listings(self):
-        p = self._provider()
-        with patch("integrations.glassdoor_provider.requests.get",
-                   return_value=_jsearch_response([_jsearch_job()])):
-            results = p.search(["SOC"], "Dallas, TX", 50)
-        assert isinstance(results, list)
-
-    def test_provider_id_is_glassdoor(self):
-        result = self._provider()._normalize(_jsearch_job())
-        assert result.provider == "glassdoor"
-
-    def test_job_id_prefixed_glassdoor(self):
-        result = self._provider()._normalize(_jsearch_job(job_id="gd123"))
-        assert result.job_id.startswith("glassdoor_")
-
-    def test_title_and_company_mapped(self):
-        result = self._provider()._normalize(
-            _jsearch_job(job_title="Intel Analyst", employer_name="Raytheon"))
-        assert result.title == "Intel Analyst"
-        assert result.company == "Raytheon"
-
-    def test_raises_on_401(self):
-        p = self._provider()
-        with patch("integrations.glassdoor_provider.requests.get",
-                   return_value=_jsearch_response([], 401)):
-            with pytest.raises(ProviderError):
-                p.search(["SOC"], "Dallas", 50)
-
-    def test_validate_key_true_on_200(self):
-        p = self._provider()
-        with patch("integrations.glassdoor_provider.requests.get",
-                   return_value=_jsearch_response([_jsearch_job()])):
-            ok, _ = p.validate_key()
-        assert ok is True
+    def test_max_results_respected(self, jsearch_provider, http_get):
+        http_get.return_value = _jsearch_response(_MANY_JSEARCH)
+        results = jsearch_provider.search(["SOC"], "Dallas", 50, max_results=5)
+        assert len(results) == 5
 
 
 # ══════════════════════════════════════════════════════════════════════════════
@@ -302,139 +247,90 @@ class TestGlassdoorProvider:
 
 class TestAdzunaProvider:
 
-    def _provider(self):
-        from integrations.adzuna_provider import AdzunaProvider
-        return AdzunaProvider(api_key="app123:key456")
+    def test_provider_id_is_adzuna(self, adzuna_default_normalized):
+        assert adzuna_default_normalized.provider == "adzuna"
+
+    @pytest.mark.parametrize("kw,attr,expected", [
+        ({"id": "az_789"},                        "job_id",   "adzuna_az_789"),
+        ({"title": "Cyber Threat Analyst"},       "title",    "Cyber Threat Analyst"),
+        ({"company": {"display_name": "Northrop Grumman"}}, "company", "Northrop Grumman"),
+        ({"location": {"display_name": "Fort Worth, TX",
+                       "area": ["TX", "Fort Worth"]}}, "location", "Fort Worth, TX"),
+        ({"created": "garbage"},                  "date_posted", None),
+        ({"category": {"label": "Remote IT Jobs"}}, "is_remote", True),
+        ({"description": "This is a 100% remote position working from home."},
+                                                  "is_remote", True),
+        ({"title": "Senior Security Analyst"},    "experience_level", "senior"),
+        ({"title": "Junior SOC Analyst"},         "experience_level", "entry"),
+    ], ids=["job_id_prefixed", "title", "company_nested",
+            "location_display_name", "bad_date", "remote_category",
+            "remote_description", "senior", "entry"])
+    def test_normalize_field(self, adzuna_provider, kw, attr, expected):
+        result = adzuna_provider._normalize(_adzuna_job(**kw))
+        assert getattr(result, attr) == expected
 
     def test_parse_creds_splits_on_colon(self):
-        from integrations.adzuna_provider import AdzunaProvider
         p = AdzunaProvider(api_key="myapp:mykey")
         app_id, app_key = p._parse_creds()
         assert app_id == "myapp"
         assert app_key == "mykey"
 
     def test_parse_creds_no_colon_fallback(self):
-        from integrations.adzuna_provider import AdzunaProvider
         p = AdzunaProvider(api_key="onlyone")
         app_id, app_key = p._parse_creds()
         assert app_id == "onlyone"
 
-    def test_returns_job_listings(self):
-        p = self._provider()
-        with patch("integrations.adzuna_provider.requests.get",
-                   return_value=_adzuna_response([_adzuna_job()])):
-            results = p.search(["SOC Analyst"], "Dallas, TX", 50)
-        assert isinstance(results, list)
+    def test_returns_job_listings(self, adzuna_provider, adzuna_ok, http_get):
+        http_get.return_value = adzuna_ok
+        results = adzuna_provider.search(["SOC Analyst"], "Dallas, TX", 50)
         assert len(results) == 1
         assert isinstance(results[0], JobListing)
 
-    def test_provider_id_is_adzuna(self):
-        result = self._provider()._normalize(_adzuna_job())
-        assert result.provider == "adzuna"
-
-    def test_job_id_prefixed_adzuna(self):
-        result = self._provider()._normalize(_adzuna_job(id="az_789"))
-        assert result.job_id == "adzuna_az_789"
-
-    def test_title_mapped(self):
-        result = self._provider()._normalize(_adzuna_job(title="Cyber Threat Analyst"))
-        assert result.title == "Cyber Threat Analyst"
-
-    def test_company_from_nested_dict(self):
-        result = self._provider()._normalize(
-            _adzuna_job(company={"display_name": "Northrop Grumman"}))
-        assert result.company == "Northrop Grumman"
-
-    def test_location_from_display_name(self):
-        result = self._provider()._normalize(
-            _adzuna_job(location={"display_name": "Fort Worth, TX", "area": ["TX","Fort Worth"]}))
-        assert "Fort Worth" in result.location
-
-    def test_salary_annual(self):
-        result = self._provider()._normalize(
-            _adzuna_job(salary_min=65000, salary_max=90000))
+    def test_salary_annual(self, adzuna_default_normalized):
+        result = adzuna_default_normalized
         assert result.salary_min == 65000.0
         assert result.salary_max == 90000.0
         assert result.salary_interval == "annual"
 
-    def test_no_salary_is_none(self):
-        raw = _adzuna_job()
-        raw.pop("salary_min"); raw.pop("salary_max")
-        result = self._provider()._normalize(raw)
+    def test_no_salary_is_none(self, adzuna_provider):
+        raw = {k: v for k, v in _ADZUNA_DEFAULTS.items()
+               if k not in ("salary_min", "salary_max")}
+        result = adzuna_provider._normalize(raw)
         assert result.salary_min is None
         assert result.salary_max is None
 
-    def test_date_posted_parsed(self):
-        result = self._provider()._normalize(
-            _adzuna_job(created="2026-02-10T08:00:00Z"))
-        assert isinstance(result.date_posted, datetime)
-        assert result.date_posted.month == 2
-
-    def test_bad_date_does_not_crash(self):
-        result = self._provider()._normalize(_adzuna_job(created="garbage"))
-        assert result.date_posted is None
-
-    def test_remote_detected_from_category(self):
-        result = self._provider()._normalize(
-            _adzuna_job(category={"label": "Remote IT Jobs"}))
-        assert result.is_remote is True
-
-    def test_remote_detected_from_description(self):
-        result = self._provider()._normalize(
-            _adzuna_job(description="This is a 100% remote position working from home."))
-        assert result.is_remote is True
-
-    def test_senior_experience_from_title(self):
-        result = self._provider()._normalize(_adzuna_job(title="Senior Security Analyst"))
-        assert result.experience_level == "senior"
-
-    def test_entry_experience_from_title(self):
-        result = self._provider()._normalize(_adzuna_job(title="Junior SOC Analyst"))
-        assert result.experience_level == "entry"
-
-    def test_raises_on_401(self):
-        p = self._provider()
-        with patch("integrations.adzuna_provider.requests.get",
-                   return_value=_adzuna_response([], 401)):
-            with pytest.raises(ProviderError) as exc:
-                p.search(["SOC"], "Dallas", 50)
-            assert exc.value.status_code == 401
-
-    def test_raises_on_429(self):
-        p = self._provider()
-        with patch("integrations.adzuna_provider.requests.get",
-                   return_value=_adzuna_response([], 429)):
-            with pytest.raises(ProviderError) as exc:
-                p.search(["SOC"], "Dallas", 50)
-            assert exc.value.status_code == 429
-
-    def test_max_results_respected(self):
-        p = self._provider()
-        jobs = [_adzuna_job(id=str(i)) for i in range(30)]
-        with patch("integrations.adzuna_provider.requests.get",
-                   return_value=_adzuna_response(jobs)):
-            results = p.search(["SOC"], "Dallas", 50, max_results=10)
-        assert len(results) <= 10
-
-    def test_validate_key_true_on_200(self):
-        p = self._provider()
-        with patch("integrations.adzuna_provider.requests.get",
-                   return_value=_adzuna_response([_adzuna_job()])):
-            ok, msg = p.validate_key()
+    def test_date_posted_parsed(self, adzuna_default_normalized):
+        assert adzuna_default_normalized.date_posted == _ADZUNA_POSTED
+
+    def test_raises_on_401(self, adzuna_provider, adzuna_401, http_get):
+        http_get.return_value = adzuna_401
+        with pytest.raises(ProviderError) as exc:
+            adzuna_provider.search(["SOC"], "Dallas", 50)
+        assert exc.value.status_code == 401
+
+    def test_raises_on_429(self, adzuna_provider, adzuna_429, http_get):
+        http_get.return_value = adzuna_429
+        with pytest.raises(ProviderError) as exc:
+            adzuna_provider.search(["SOC"], "Dallas", 50)
+        assert exc.value.status_code == 429
+
+    def test_max_results_respected(self, adzuna_provider, http_get):
+        http_get.return_value = _adzuna_response(_MANY_ADZUNA)
+        results = adzuna_provider.search(["SOC"], "Dallas", 50, max_results=10)
+        assert len(results) == 10
+
+    def test_validate_key_true_on_200(self, adzuna_provider, adzuna_ok, http_get):
+        http_get.return_value = adzuna_ok
+        ok, msg = adzuna_provider.validate_key()
         assert ok is True
         assert "Adzuna" in msg
 
-    def test_validate_key_false_on_401(self):
-        p = self._provider()
-        with patch("integrations.adzuna_provider.requests.get",
-                   return_value=_adzuna_response([], 401)):
-            ok, _ = p.validate_key()
+    def test_validate_key_false_on_401(self, adzuna_provider, adzuna_401, http_get):
+        http_get.return_value = adzuna_401
+        ok, _ = adzuna_provider.validate_key()
         assert ok is False
 
-    def test_network_error_raises_provider_error(self):
-        import requests as req
-        p = self._provider()
-        with patch("integrations.adzuna_provider.requests.get",
-                   side_effect=req.RequestException("timeout")):
-            with pytest.raises(ProviderError):
-                p.search(["SOC"], "Dallas", 50)
+    def test_network_error_raises_provider_error(self, adzuna_provider, http_get):
+        http_get.side_effect = requests.RequestException("timeout")
+        with pytest.raises(ProviderError):
+            adzuna_provider.search(["SOC"], "Dallas", 50)
@@ -11,14 +11,16 @@ from datetime import datetime
 from unittest.mock import MagicMock, patch
 
 from core.job_model import JobListing, _haversine
+from core.utils import parse_iso_date
 from integrations.usajobs_provider import UsajobsProvider
 from integrations.base_provider import ProviderError
 
 
 # ── Fixtures ──────────────────────────────────────────────────────────────────
 
-def _make_provider():
-    return UsajobsProvider(api_key="test-api-key-12345", user_email="test@example.com")
+def _make_provider(keep_raw: bool = True):
+    return UsajobsProvider(api_key="test-api-key-12345", user_email="test@example.com",
+                           keep_raw=keep_raw)
 
 
 def _make_raw_item(overrides: dict = None) -> dict:
@@ -123,6 +125,27 @@ class TestJobListing:
                          location="Unknown", latitude=None, longitude=None)
         assert job.is_within_radius(32.7459, -96.4685, 50) == True
 
+    def test_filter_within_radius_matches_per_job_check(self):
+        """The batch helper keeps the same listings, in order, as is_within_radius."""
+        dallas  = JobListing(job_id="a", provider="x", title="T", company="C",
+                             location="Dallas, TX", latitude=32.7767, longitude=-96.7970)
+        seattle = JobListing(job_id="b", provider="x", title="T", company="C",
+                             location="Seattle, WA", latitude=47.6062, longitude=-122.3321)
+        unknown = JobListing(job_id="c", provider="x", title="T", company="C",
+                             location="Unknown")
+        jobs = [dallas, seattle, unknown]
+        assert JobListing.filter_within_radius(jobs, 32.7459, -96.4685, 50) == [dallas, unknown]
+        assert JobListing.filter_within_radius(jobs, 32.7459, -96.4685, 5000) == jobs
+
+    def test_filter_within_radius_negative_radius_keeps_only_uncoordinated(self):
+        """Like is_within_radius, a negative radius rejects every located job."""
+        forney  = JobListing(job_id="a", provider="x", title="T", company="C",
+                             location="Forney, TX", latitude=32.7459, longitude=-96.4685)
+        unknown = JobListing(job_id="c", provider="x", title="T", company="C",
+                             location="Unknown")
+        assert not forney.is_within_radius(32.7459, -96.4685, -10)
+        assert JobListing.filter_within_radius([forney, unknown], 32.7459, -96.4685, -10) == [unknown]
+
     def test_haversine_dallas_to_forney(self):
         """Dallas to Forney TX should be roughly 25 miles."""
         dist = _haversine(32.7767, -96.7970, 32.7459, -96.4685)
@@ -172,6 +195,20 @@ class TestUsajobsNormalize:
         assert listing.salary_max == pytest.approx(78000.0)
         assert listing.salary_interval == "annual"
 
+    @pytest.mark.parametrize("code,expected_min", [
+        ("PW", 2000 * 52),
+        ("PM", 2000 * 12),
+        ("PD", 2000 * 260),
+    ])
+    def test_normalize_weekly_monthly_daily_salary_converted_to_annual(self, code, expected_min):
+        raw = _make_raw_item({
+            "PositionRemuneration": [{"MinimumRange": "2000", "MaximumRange": "3000",
+                                       "RateIntervalCode": code}]
+        })
+        listing = self.provider._normalize(raw)
+        assert listing.salary_min == pytest.approx(expected_min)
+        assert listing.salary_interval == "annual"
+
     def test_normalize_hybrid_telework(self):
         listing = self.provider._normalize(_make_raw_item())
         assert listing.is_hybrid == True
@@ -233,6 +270,31 @@ class TestUsajobsNormalize:
         listing = self.provider._normalize(raw)
         assert listing.raw == raw
 
+    def test_normalize_drops_raw_by_default(self):
+        listing = _make_provider(keep_raw=False)._normalize(_make_raw_item())
+        assert listing.raw is None
+
+
+# ── parse_iso_date (USAJobs timestamps) ──────────────────────────────────────
+
+class TestParseIsoDate:
+
+    @pytest.mark.parametrize("value, expected", [
+        ("2026-02-01T00:00:00.0000000Z", datetime(2026, 2, 1)),
+        ("2026-02-01T10:11:12.1234567Z", datetime(2026, 2, 1, 10, 11, 12, 123450)),
+        ("2026-02-19T10:11:12",          datetime(2026, 2, 19, 10, 11, 12)),
+        ("2026-02-19",                   datetime(2026, 2, 19)),
+    ])
+    def test_parses_usajobs_shapes(self, value, expected):
+        assert parse_iso_date(value) == expected
+
+    @pytest.mark.parametrize("value", [
+        "20260219", "2026-W07-4", "2026-02-19 14:00:00", "2026-02-19T14",
+        "2026-02-19T10:11:12+05:00", "not a date", "",
+    ])
+    def test_unsupported_forms_return_none(self, value):
+        assert parse_iso_date(value) is None
+
 
 # ── UsajobsProvider.search tests ─────────────────────────────────────────────
 
@@ -241,7 +303,7 @@ class TestUsajobsSearch:
     def setup_method(self):
         self.provider = _make_provider()
 
-    @patch("integrations.usajobs_provider.requests.get")
+    @patch("integrations.usajobs_provider.requests.Session.get")
     def test_search_returns_listings(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -251,7 +313,7 @@ class TestUsajobsSearch:
         assert len(results) == 1
         assert isinstance(results[0], JobListing)
 
-    @patch("integrations.usajobs_provider.requests.get")
+    @patch("integrations.usajobs_provider.requests.Session.get")
     def test_search_empty_results(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -260,28 +322,28 @@ class TestUsajobsSearch:
         results = self.provider.search(["very obscure title xyz"], "Dallas, TX", 50)
         assert results == []
 
-    @patch("integrations.usajobs_provider.requests.get")
+    @patch("integrations.usajobs_provider.requests.Session.get")
     def test_search_raises_provider_error_on_401(self, mock_get):
         mock_get.return_value = MagicMock(status_code=401)
         with pytest.raises(ProviderError) as exc_info:
             self.provider.search(["analyst"], "Dallas, TX", 50)
         assert exc_info.value.status_code == 401
 
-    @patch("integrations.usajobs_provider.requests.get")
+    @patch("integrations.usajobs_provider.requests.Session.get")
     def test_search_raises_provider_error_on_429(self, mock_get):
         mock_get.return_value = MagicMock(status_code=429)
         with pytest.raises(ProviderError) as exc_info:
             self.provider.search(["analyst"], "Dallas, TX", 50)
         assert exc_info.value.status_code == 429
 
-    @patch("integrations.usajobs_provider.requests.get")
+    @patch("integrations.usajobs_provider.requests.Session.get")
     def test_search_raises_provider_error_on_network_failure(self, mock_get):
         import requests as req
         mock_get.side_effect = req.RequestException("Connection refused")
         with pytest.raises(ProviderError):
             self.provider.search(["analyst"], "Dallas, TX", 50)
 
-    @patch("integrations.usajobs_provider.requests.get")
+    @patch("integrations.usajobs_provider.requests.Session.get")
     def test_search_skips_malformed_items_gracefully(self, mock_get):
         """A bad item in the results should be skipped, not crash the search."""
         good = _make_raw_item()
@@ -293,19 +355,39 @@ class TestUsajobsSearch:
         results = self.provider.search(["analyst"], "Dallas, TX", 50)
         assert len(results) == 1  # Only the good one
 
-    @patch("integrations.usajobs_provider.requests.get")
+    @patch("integrations.usajobs_provider.requests.Session.get")
     def test_search_sends_correct_headers(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
             json=lambda: _make_api_response([])
         )
         self.provider.search(["analyst"], "Dallas, TX", 50)
-        call_kwargs = mock_get.call_args
-        headers = call_kwargs[1]["headers"]
+        headers = self.provider._session.headers
         assert headers["Authorization-Key"] == "test-api-key-12345"
         assert headers["User-Agent"] == "test@example.com"
 
-    @patch("integrations.usajobs_provider.requests.get")
+    @patch("integrations.usajobs_provider.requests.Session.get")
+    def test_search_merges_keyword_queries_by_position_id(self, mock_get):
+        mock_get.return_value = MagicMock(
+            status_code=200,
+            json=lambda: _make_api_response([_make_raw_item()])
+        )
+        results = self.provider.search(["analyst", "engineer"], "Dallas, TX", 50)
+        assert mock_get.call_count == 5  # capped at _MAX_INDIVIDUAL_SEARCHES
+        assert len(results) == 1
+
+    @patch("integrations.usajobs_provider.requests.Session.get")
+    def test_search_stops_after_first_query_when_page_fills_cap(self, mock_get):
+        items = [_make_raw_item({"PositionID": f"POS-{i}"}) for i in range(10)]
+        mock_get.return_value = MagicMock(
+            status_code=200,
+            json=lambda: _make_api_response(items)
+        )
+        results = self.provider.search(["analyst"], "Dallas, TX", 50, max_results=10)
+        assert mock_get.call_count == 1
+        assert len(results) == 10
+
+    @patch("integrations.usajobs_provider.requests.Session.get")
     def test_search_max_results_capped_at_500(self, mock_get):
         mock_get.return_value = MagicMock(
             status_code=200,
@@ -323,21 +405,21 @@ class TestUsajobsValidateKey:
     def setup_method(self):
         self.provider = _make_provider()
 
-    @patch("integrations.usajobs_provider.requests.get")
+    @patch("integrations.usajobs_provider.requests.Session.get")
     def test_validate_returns_true_on_200(self, mock_get):
         mock_get.return_value = MagicMock(status_code=200)
         valid, msg = self.provider.validate_key()
         assert valid == True
         assert "successfully" in msg.lower()
 
-    @patch("integrations.usajobs_provider.requests.get")
+    @patch("integrations.usajobs_provider.requests.Session.get")
     def test_validate_returns_false_on_401(self, mock_get):
         mock_get.return_value = MagicMock(status_code=401)
         valid, msg = self.provider.validate_key()
         assert valid == False
         assert len(msg) > 0
 
-    @patch("integrations.usajobs_provider.requests.get")
+    @patch("integrations.usajobs_provider.requests.Session.get")
     def test_validate_returns_false_on_network_error(self, mock_get):
         import requests as req
         mock_get.side_effect = req.RequestException("timeout")
@@ -0,0 +1,20 @@
+"""
+ui/components/fonts.py
+=======================
+Shared CTkFont instances. Every CTkFont registers a Tk named font and
+queries its metrics, so widgets that use the same size/weight share one.
+"""
+
+from functools import lru_cache
+from typing import Optional
+import customtkinter as ctk
+
+
+@lru_cache(maxsize=32)
+def font(size: int, weight: str = "normal", family: Optional[str] = None) -> ctk.CTkFont:
+    """
+    Return the shared CTkFont for (size, weight, family).
+    Must be called after the Tk root exists — the app has exactly one root,
+    so cached fonts stay valid for the life of the process.
+    """
+    return ctk.CTkFont(size=size, weight=weight, family=family)
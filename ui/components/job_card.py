@@ -4,14 +4,27 @@ ui/components/job_card.py
 Compact/expandable job listing card used in the Jobs panel.
 """
 
-import webbrowser
 import customtkinter as ctk
+from datetime import datetime, timezone
 from core.job_model import JobListing
 from core.utils import format_salary, days_ago
+from ui.components.fonts import font as _font
+
+# Provider badge colors
+_PROVIDER_COLORS = {
+    "usajobs": "#1565C0", "indeed": "#2164F3",
+    "linkedin": "#0077B5", "glassdoor": "#0CAA41",
+    "adzuna": "#FF6B35",
+}
 
 
 class JobCard(ctk.CTkFrame):
-    """A single job listing displayed as an expandable card."""
+    """
+    A single job listing displayed as an expandable card.
+
+    Widgets are built once; bind() repopulates them for another listing so
+    JobsPanel can recycle cards instead of destroying and rebuilding them.
+    """
 
     def __init__(self, parent, job: JobListing, main_window, **kwargs):
         super().__init__(parent, fg_color=("gray90", "gray20"),
@@ -19,7 +32,9 @@ class JobCard(ctk.CTkFrame):
         self.job = job
         self.main_window = main_window
         self._expanded = False
+        self._applied_label = None
         self._build()
+        self.bind_job(job)
 
     def _build(self):
         self.grid_columnconfigure(0, weight=1)
@@ -30,52 +45,31 @@ class JobCard(ctk.CTkFrame):
         compact.grid_columnconfigure(1, weight=1)
 
         # Provider badge
-        provider_colors = {
-            "usajobs": "#1565C0", "indeed": "#2164F3",
-            "linkedin": "#0077B5", "glassdoor": "#0CAA41",
-            "adzuna": "#FF6B35",
-        }
-        badge_color = provider_colors.get(self.job.provider, "gray")
-        ctk.CTkLabel(
+        self._badge = ctk.CTkLabel(
             compact,
-            text=self.job.provider.upper(),
-            font=ctk.CTkFont(size=9, weight="bold"),
+            font=_font(9, "bold"),
             text_color="white",
-            fg_color=badge_color,
             corner_radius=4,
             width=64, height=20,
-        ).grid(row=0, column=0, rowspan=2, padx=(0, 12), sticky="n", pady=2)
+        )
+        self._badge.grid(row=0, column=0, rowspan=2, padx=(0, 12), sticky="n", pady=2)
 
         # Title and company
-        ctk.CTkLabel(compact, text=self.job.title,
-                     font=ctk.CTkFont(size=14, weight="bold"),
-                     anchor="w").grid(row=0, column=1, sticky="w")
-        ctk.CTkLabel(compact,
-                     text=f"{self.job.company}  •  {self.job.location}",
-                     font=ctk.CTkFont(size=12), text_color="gray",
-                     anchor="w").grid(row=1, column=1, sticky="w")
+        self._title = ctk.CTkLabel(compact, font=_font(14, "bold"), anchor="w")
+        self._title.grid(row=0, column=1, sticky="w")
+        self._subtitle = ctk.CTkLabel(compact, font=_font(12),
+                                      text_color="gray", anchor="w")
+        self._subtitle.grid(row=1, column=1, sticky="w")
 
         # Right side — salary + date
         right = ctk.CTkFrame(compact, fg_color="transparent")
         right.grid(row=0, column=2, rowspan=2, padx=(12, 0), sticky="e")
 
-        salary_str = format_salary(
-            self.job.salary_min, self.job.salary_max,
-            self.job.salary_interval,
-        )
-        ctk.CTkLabel(right, text=salary_str,
-                     font=ctk.CTkFont(size=12, weight="bold"),
-                     anchor="e").pack(anchor="e")
-
-        date_str = days_ago(self.job.date_posted) if self.job.date_posted else ""
-        tags = []
-        if self.job.is_remote: tags.append("🌐 Remote")
-        if self.job.is_hybrid: tags.append("🏢 Hybrid")
-        tag_str = "  ".join(tags)
-        ctk.CTkLabel(right,
-                     text=f"{date_str}  {tag_str}".strip(),
-                     font=ctk.CTkFont(size=11), text_color="gray",
-                     anchor="e").pack(anchor="e")
+        self._salary = ctk.CTkLabel(right, font=_font(12, "bold"), anchor="e")
+        self._salary.pack(anchor="e")
+        self._meta = ctk.CTkLabel(right, font=_font(11),
+                                  text_color="gray", anchor="e")
+        self._meta.pack(anchor="e")
 
         # Expand toggle
         self._expand_btn = ctk.CTkButton(
@@ -91,20 +85,19 @@ class JobCard(ctk.CTkFrame):
         self._detail_frame = ctk.CTkFrame(self, fg_color="transparent")
         # Not gridded until expanded
 
-        if self.job.description:
-            ctk.CTkLabel(
-                self._detail_frame, text=self.job.description[:600],
-                font=ctk.CTkFont(size=12), text_color="gray",
-                wraplength=680, justify="left", anchor="w",
-            ).pack(fill="x", padx=14, pady=(0, 8))
+        self._description = ctk.CTkLabel(
+            self._detail_frame,
+            font=_font(12), text_color="gray",
+            wraplength=680, justify="left", anchor="w",
+        )
 
         btn_row = ctk.CTkFrame(self._detail_frame, fg_color="transparent")
-        btn_row.pack(fill="x", padx=14, pady=(0, 10))
+        btn_row.pack(side="bottom", fill="x", padx=14, pady=(0, 10))
 
         ctk.CTkButton(
             btn_row, text="🔗  View Full Posting",
             width=160, height=32,
-            command=lambda: webbrowser.open(self.job.url) if self.job.url else None,
+            command=self._open_posting,
         ).pack(side="left", padx=(0, 8))
 
         ctk.CTkButton(
@@ -114,6 +107,35 @@ class JobCard(ctk.CTkFrame):
             command=self._mark_applied,
         ).pack(side="left")
 
+    def bind_job(self, job: JobListing):
+        """Show another listing in this card, collapsed and not marked applied."""
+        self.job = job
+        self._badge.configure(text=job.provider.upper(),
+                              fg_color=_PROVIDER_COLORS.get(job.provider, "gray"))
+        self._title.configure(text=job.title)
+        self._subtitle.configure(text=f"{job.company}  •  {job.location}")
+        self._salary.configure(text=format_salary(
+            job.salary_min, job.salary_max, job.salary_interval,
+        ))
+
+        date_str = days_ago(job.date_posted) if job.date_posted else ""
+        tags = []
+        if job.is_remote: tags.append("🌐 Remote")
+        if job.is_hybrid: tags.append("🏢 Hybrid")
+        tag_str = "  ".join(tags)
+        self._meta.configure(text=f"{date_str}  {tag_str}".strip())
+
+        if job.description:
+            self._description.configure(text=job.description[:600])
+            self._description.pack(side="top", fill="x", padx=14, pady=(0, 8))
+        else:
+            self._description.pack_forget()
+
+        if self._expanded:
+            self._toggle_expand()
+        if self._applied_label is not None:
+            self._unmark_applied()
+
     def _toggle_expand(self):
         self._expanded = not self._expanded
         if self._expanded:
@@ -123,25 +145,35 @@ class JobCard(ctk.CTkFrame):
             self._detail_frame.grid_remove()
             self._expand_btn.configure(text="▼")
 
+    def _open_posting(self):
+        if self.job.url:
+            import webbrowser  # Deferred: most sessions never click through
+            webbrowser.open(self.job.url)
+
     def _mark_applied(self):
         """Save this job to the applications tracker."""
-        from db import jobs_repo
-        from datetime import datetime, timezone
-        try:
-            jobs_repo.add_application({
-                "job_id":       self.job.job_id,
-                "provider":     self.job.provider,
-                "company":      self.job.company,
-                "title":        self.job.title,
-                "location":     self.job.location,
-                "job_url":      self.job.url,
-                "date_applied": datetime.now(timezone.utc).isoformat(),
-                "status":       "Applied",
-            })
-            # Visual confirmation
-            self.configure(fg_color=("gray80", "gray15"))
-            ctk.CTkLabel(self, text="✓ Added to Tracker",
-                         text_color="#4CAF50",
-                         font=ctk.CTkFont(size=12)).grid(row=2, column=0, pady=4)
-        except Exception as e:
-            print(f"Error saving application: {e}")
+        if self._applied_label is not None:
+            return   # Already marked — don't queue a duplicate row
+        self.main_window.queue_application({
+            "job_id":       self.job.job_id,
+            "provider":     self.job.provider,
+            "company":      self.job.company,
+            "title":        self.job.title,
+            "location":     self.job.location,
+            "job_url":      self.job.url,
+            "date_applied": datetime.now(timezone.utc).isoformat(),
+            "status":       "Applied",
+        }, on_error=lambda job=self.job: self._unmark_applied() if self.job is job else None)
+        # Optimistic visual confirmation; the write is batched by main_window
+        self.configure(fg_color=("gray80", "gray15"))
+        self._applied_label = ctk.CTkLabel(self, text="✓ Added to Tracker",
+                                           text_color="#4CAF50",
+                                           font=_font(12))
+        self._applied_label.grid(row=2, column=0, pady=4)
+
+    def _unmark_applied(self):
+        """Roll back the confirmation if the batched save failed."""
+        self.configure(fg_color=("gray90", "gray20"))
+        if self._applied_label is not None:
+            self._applied_label.destroy()
+            self._applied_label = None
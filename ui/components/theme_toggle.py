@@ -11,8 +11,12 @@ from core import config_manager
 class ThemeToggle(ctk.CTkSegmentedButton):
     """Three-way toggle for app theme saved to config."""
 
+    # Rapid toggling is coalesced into one config write after this delay
+    SAVE_DELAY_MS = 500
+
     def __init__(self, parent, config: dict, **kwargs):
         self._config = config
+        self._save_after_id = None
         current = config.get("theme", "system").capitalize()
 
         super().__init__(
@@ -28,4 +32,20 @@ class ThemeToggle(ctk.CTkSegmentedButton):
         theme = value.lower()
         ctk.set_appearance_mode(theme)
         self._config["theme"] = theme
+        self._schedule_save()
+
+    def _schedule_save(self):
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+        self._save_after_id = self.after(self.SAVE_DELAY_MS, self._flush_save)
+
+    def _flush_save(self):
+        self._save_after_id = None
         config_manager.save(self._config)
+
+    def destroy(self):
+        # Write a still-pending change so closing the app never loses it
+        if self._save_after_id is not None:
+            self.after_cancel(self._save_after_id)
+            self._flush_save()
+        super().destroy()
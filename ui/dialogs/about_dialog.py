@@ -6,6 +6,7 @@ About dialog: version, tagline, GitHub link, privacy statement, MIT license.
 
 import webbrowser
 import customtkinter as ctk
+from ui.components.fonts import font as _font
 
 APP_VERSION  = "1.0.4"
 GITHUB_URL   = "https://github.com/Irehund/JobTracker"
@@ -31,19 +32,34 @@ FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT.\
 
 
 class AboutDialog(ctk.CTkToplevel):
-    """About / credits dialog launched from the sidebar."""
+    """
+    About / credits dialog launched from the sidebar.
+    Closing only hides it; MainWindow keeps the instance and calls show().
+    """
 
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         self.title("About JobTrack")
-        self.geometry("480x540")
         self.resizable(False, False)
+        self.protocol("WM_DELETE_WINDOW", self.close)
         self.grab_set()
+        self._center_on_parent(parent)
         self._build()
+
+    def show(self, parent):
+        """Re-display the dialog after close()."""
+        self.deiconify()
+        self.lift()
+        self.grab_set()
         self._center_on_parent(parent)
 
+    def close(self):
+        self.grab_release()
+        self.withdraw()
+
     def _center_on_parent(self, parent):
-        self.update_idletasks()
+        # Size is fixed, so only the parent's geometry is needed — no
+        # update_idletasks() layout pass over our own widgets
         px = parent.winfo_rootx() + parent.winfo_width()  // 2
         py = parent.winfo_rooty() + parent.winfo_height() // 2
         self.geometry(f"480x540+{px - 240}+{py - 270}")
@@ -58,19 +74,19 @@ class AboutDialog(ctk.CTkToplevel):
 
         ctk.CTkLabel(
             header, text="JobTrack",
-            font=ctk.CTkFont(size=32, weight="bold"),
+            font=_font(32, "bold"),
         ).pack(pady=(24, 4))
 
         ctk.CTkLabel(
             header,
             text=f"v{APP_VERSION}  •  Job Search Manager",
-            font=ctk.CTkFont(size=13), text_color="gray",
+            font=_font(13), text_color="gray",
         ).pack(pady=(0, 8))
 
         ctk.CTkLabel(
             header,
             text="Find, track, and land your next cybersecurity role.",
-            font=ctk.CTkFont(size=12), text_color="gray",
+            font=_font(12), text_color="gray",
         ).pack(pady=(0, 20))
 
         # ── Privacy statement ─────────────────────────────────────────────────
@@ -80,7 +96,7 @@ class AboutDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             privacy,
             text="🔒  Privacy",
-            font=ctk.CTkFont(size=13, weight="bold"), anchor="w",
+            font=_font(13, "bold"), anchor="w",
         ).pack(fill="x")
 
         ctk.CTkLabel(
@@ -91,7 +107,7 @@ class AboutDialog(ctk.CTkToplevel):
                 "stays on your computer or your own Google account.\n"
                 "JobTrack connects only to the job board APIs you configure."
             ),
-            font=ctk.CTkFont(size=12), text_color="gray",
+            font=_font(12), text_color="gray",
             justify="left", anchor="w",
         ).pack(fill="x", pady=(4, 0))
 
@@ -104,11 +120,11 @@ class AboutDialog(ctk.CTkToplevel):
         ctk.CTkLabel(
             license_frame,
             text="📄  License",
-            font=ctk.CTkFont(size=13, weight="bold"), anchor="w",
+            font=_font(13, "bold"), anchor="w",
         ).grid(row=0, column=0, sticky="w", pady=(0, 4))
 
         textbox = ctk.CTkTextbox(
-            license_frame, font=ctk.CTkFont(size=10, family="Courier"),
+            license_frame, font=_font(10, family="Courier"),
             fg_color=("gray90", "gray15"), height=130,
         )
         textbox.grid(row=1, column=0, sticky="nsew")
@@ -131,5 +147,5 @@ class AboutDialog(ctk.CTkToplevel):
             text="Close",
             width=80, height=36,
             fg_color=("gray75", "gray35"),
-            command=self.destroy,
+            command=self.close,
         ).pack(side="right")
@@ -9,14 +9,27 @@ Changes are not applied until Save is clicked — Cancel discards everything.
 """
 
 import copy
+import logging
+import queue
 import threading
 import customtkinter as ctk
 from core import config_manager, keyring_manager
 from core.utils import normalize_state
+from ui.components.fonts import font as _font
+
+logger = logging.getLogger("jobtrack.ui.preferences")
 
 
 APP_VERSION = "1.0.0"
 
+# Search radius slider stops, and the nearest stop for every slider value
+# 10..100 so the drag callback is a single index instead of a min() scan
+RADIUS_SNAPS = (10, 25, 50, 75, 100)
+_SNAP_LUT = tuple(min(RADIUS_SNAPS, key=lambda s: abs(s - v)) for v in range(10, 101))
+
+# Providers whose enabled flag is written back to config on Save
+_TOGGLEABLE_PROVIDERS = ("indeed", "linkedin", "glassdoor", "adzuna")
+
 
 class PreferencesDialog(ctk.CTkToplevel):
     """Tabbed preferences editor launched from the sidebar."""
@@ -24,7 +37,6 @@ class PreferencesDialog(ctk.CTkToplevel):
     def __init__(self, parent, config: dict, on_save=None, **kwargs):
         super().__init__(parent, **kwargs)
         self.title("Preferences")
-        self.geometry("680x560")
         self.resizable(False, False)
         self.grab_set()   # Modal
 
@@ -32,12 +44,22 @@ class PreferencesDialog(ctk.CTkToplevel):
         self._config   = copy.deepcopy(config)
         self._on_save  = on_save
         self._widgets  = {}   # named widget refs for reading values on Save
+        self._key_originals = {}   # key_name -> value loaded from keyring
+        self._enabled_vars  = {}   # provider id -> enabled BooleanVar
+        self._key_entries   = {}   # key_name -> CTkEntry
+        self._key_results   = None  # Queue fed by the keyring writer while a save is in flight
+        self._key_failures  = []
+        self._theme_after_id = None
+        self._applied_theme  = self._config.get("theme", "system")
+        self._token_path = config_manager.get_config_dir() / "google_token.json"
+        self._google_connected = False   # Checked once when the Tracker tab is built
 
-        self._build()
         self._center_on_parent(parent)
+        self._build()
 
     def _center_on_parent(self, parent):
-        self.update_idletasks()
+        # Size is fixed, so only the parent's geometry is needed — no
+        # update_idletasks() layout pass over our own widgets
         px = parent.winfo_rootx() + parent.winfo_width()  // 2
         py = parent.winfo_rooty() + parent.winfo_height() // 2
         w, h = 680, 560
@@ -50,17 +72,22 @@ class PreferencesDialog(ctk.CTkToplevel):
         self.grid_rowconfigure(1, weight=0)
         self.grid_columnconfigure(0, weight=1)
 
-        tabs = ctk.CTkTabview(self, anchor="nw")
+        tabs = ctk.CTkTabview(self, anchor="nw", command=self._on_tab_changed)
         tabs.grid(row=0, column=0, sticky="nsew", padx=16, pady=(16, 8))
-
-        for name in ["Location", "Job Search", "Providers & Keys", "Tracker", "Appearance"]:
+        self._tabs = tabs
+
+        # Only the first tab is built up front; the rest on first view
+        self._tab_builders = {
+            "Location":         self._build_location_tab,
+            "Job Search":       self._build_search_tab,
+            "Providers & Keys": self._build_providers_tab,
+            "Tracker":          self._build_tracker_tab,
+            "Appearance":       self._build_appearance_tab,
+        }
+        self._built_tabs: set = set()
+        for name in self._tab_builders:
             tabs.add(name)
-
-        self._build_location_tab(tabs.tab("Location"))
-        self._build_search_tab(tabs.tab("Job Search"))
-        self._build_providers_tab(tabs.tab("Providers & Keys"))
-        self._build_tracker_tab(tabs.tab("Tracker"))
-        self._build_appearance_tab(tabs.tab("Appearance"))
+        self._ensure_tab_built("Location")
 
         # ── Save / Cancel buttons ─────────────────────────────────────────────
         btn_row = ctk.CTkFrame(self, fg_color="transparent")
@@ -72,10 +99,18 @@ class PreferencesDialog(ctk.CTkToplevel):
         ctk.CTkButton(btn_row, text="Save", width=100,
                       command=self._save).pack(side="right")
 
-        self._status = ctk.CTkLabel(btn_row, text="", font=ctk.CTkFont(size=12),
+        self._status = ctk.CTkLabel(btn_row, text="", font=_font(12),
                                     text_color="gray")
         self._status.pack(side="left")
 
+    def _on_tab_changed(self):
+        self._ensure_tab_built(self._tabs.get())
+
+    def _ensure_tab_built(self, name: str):
+        if name not in self._built_tabs:
+            self._built_tabs.add(name)
+            self._tab_builders[name](self._tabs.tab(name))
+
     # ── Location tab ──────────────────────────────────────────────────────────
 
     def _build_location_tab(self, frame):
@@ -110,12 +145,14 @@ class PreferencesDialog(ctk.CTkToplevel):
                                     width=72, anchor="w")
         radius_label.pack(side="right")
 
-        SNAPS = [10, 25, 50, 75, 100]
+        last_snap = [radius_var.get()]
 
         def _on_slide(val):
-            snapped = min(SNAPS, key=lambda s: abs(s - int(val)))
-            radius_var.set(snapped)
-            radius_label.configure(text=f"{snapped} miles")
+            snapped = _SNAP_LUT[int(val) - 10]
+            radius_var.set(snapped)   # The slider itself wrote the raw value
+            if snapped != last_snap[0]:
+                last_snap[0] = snapped
+                radius_label.configure(text=f"{snapped} miles")
 
         slider = ctk.CTkSlider(radius_frame, from_=10, to=100,
                                variable=radius_var, command=_on_slide)
@@ -175,46 +212,65 @@ class PreferencesDialog(ctk.CTkToplevel):
 
         prov_cfg = self._config.get("providers", {})
 
+        # One grid per card — checkbox row, one (label, entry) row per key,
+        # separator — with no intermediate layout frames
         for i, (pid, label, always_on, key_names) in enumerate(providers):
             card = ctk.CTkFrame(scroll, fg_color=("gray88", "gray18"), corner_radius=8)
             card.grid(row=i, column=0, sticky="ew", pady=4, padx=4)
-            card.grid_columnconfigure(0, weight=1)
-
-            header = ctk.CTkFrame(card, fg_color="transparent")
-            header.grid(row=0, column=0, sticky="ew", padx=12, pady=(10,4))
+            card.grid_columnconfigure(1, weight=1)
 
             enabled_var = ctk.BooleanVar(value=always_on or
                                           prov_cfg.get(pid, {}).get("enabled", False))
-            self._widgets[f"enabled_{pid}"] = enabled_var
+            self._enabled_vars[pid] = enabled_var
 
-            cb = ctk.CTkCheckBox(header, text=label, variable=enabled_var,
-                                 state="disabled" if always_on else "normal")
-            cb.pack(side="left")
+            ctk.CTkCheckBox(card, text=label, variable=enabled_var,
+                            state="disabled" if always_on else "normal").grid(
+                row=0, column=0, columnspan=2, sticky="w", padx=12, pady=(10,4))
 
             # Key entry fields
-            for key_name in key_names:
+            for row, key_name in enumerate(key_names, 1):
                 is_email = "email" in key_name
-                row_frame = ctk.CTkFrame(card, fg_color="transparent")
-                row_frame.grid(sticky="ew", padx=12, pady=2)
-                row_frame.grid_columnconfigure(1, weight=1)
-
                 ph = "Email address" if is_email else f"{key_name.replace('_',' ').title()} API key"
-                ctk.CTkLabel(row_frame, text=ph, width=160, anchor="w",
-                             font=ctk.CTkFont(size=12), text_color="gray").grid(
-                    row=0, column=0, sticky="w")
+                ctk.CTkLabel(card, text=ph, width=160, anchor="w",
+                             font=_font(12), text_color="gray").grid(
+                    row=row, column=0, sticky="w", padx=(12,0), pady=2)
 
-                entry = ctk.CTkEntry(row_frame, show="" if is_email else "•",
+                entry = ctk.CTkEntry(card, show="" if is_email else "•",
                                      placeholder_text="not set")
-                entry.grid(row=0, column=1, sticky="ew", padx=(8,0))
-
-                existing = keyring_manager.get_key(key_name) or ""
-                if existing:
-                    entry.insert(0, existing)
-                self._widgets[f"key_{key_name}"] = entry
+                entry.grid(row=row, column=1, sticky="ew", padx=(8,12), pady=2)
+                self._key_entries[key_name] = entry
 
             ctk.CTkFrame(card, height=1, fg_color=("gray80","gray30")).grid(
+                row=len(key_names) + 1, column=0, columnspan=2,
                 sticky="ew", padx=12, pady=(6,0))
 
+        # Keyring reads can take a noticeable moment each (OS credential
+        # store), so fill the entries from a thread after the tab paints.
+        loaded = queue.Queue(maxsize=1)
+        threading.Thread(target=self._load_keys, args=(list(self._key_entries), loaded),
+                         daemon=True).start()
+        self._poll_loaded_keys(loaded)
+
+    @staticmethod
+    def _load_keys(key_names: list, loaded: queue.Queue):
+        """Read stored keys (worker thread) and hand them back on loaded."""
+        loaded.put({k: keyring_manager.get_key(k) or "" for k in key_names})
+
+    def _poll_loaded_keys(self, loaded: queue.Queue):
+        """Fill the key entries on the Tk thread once the keyring read is done."""
+        if not self.winfo_exists():
+            return   # Dialog closed before the read finished
+        try:
+            existing = loaded.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_loaded_keys, loaded)
+            return
+        for key_name, val in existing.items():
+            self._key_originals[key_name] = val
+            entry = self._key_entries[key_name]
+            if val and not entry.get():   # Don't clobber what the user typed
+                entry.insert(0, val)
+
     # ── Tracker tab ───────────────────────────────────────────────────────────
 
     def _build_tracker_tab(self, frame):
@@ -222,7 +278,7 @@ class PreferencesDialog(ctk.CTkToplevel):
         mode = self._config.get("tracker", {}).get("mode", "local")
 
         ctk.CTkLabel(frame, text="Application Tracker Storage",
-                     font=ctk.CTkFont(size=14, weight="bold"), anchor="w").grid(
+                     font=_font(14, "bold"), anchor="w").grid(
             row=0, column=0, sticky="w", padx=12, pady=(16,8))
 
         mode_var = ctk.StringVar(value=mode)
@@ -236,7 +292,7 @@ class PreferencesDialog(ctk.CTkToplevel):
         for i, (val, label, desc) in enumerate(options, 1):
             rb = ctk.CTkRadioButton(frame, text=label, variable=mode_var, value=val)
             rb.grid(row=i, column=0, sticky="w", padx=24, pady=(4,0))
-            ctk.CTkLabel(frame, text=desc, font=ctk.CTkFont(size=11),
+            ctk.CTkLabel(frame, text=desc, font=_font(11),
                          text_color="gray", anchor="w").grid(
                 row=i, column=1, sticky="w", padx=8)
 
@@ -244,9 +300,10 @@ class PreferencesDialog(ctk.CTkToplevel):
         ctk.CTkFrame(frame, height=1, fg_color=("gray80","gray30")).grid(
             row=5, column=0, columnspan=2, sticky="ew", padx=12, pady=12)
 
+        self._google_connected = self._token_path.exists()
         self._google_status = ctk.CTkLabel(
             frame, text=self._google_auth_status(),
-            font=ctk.CTkFont(size=12), text_color="gray", anchor="w")
+            font=_font(12), text_color="gray", anchor="w")
         self._google_status.grid(row=6, column=0, sticky="w", padx=12)
 
         btn_frame = ctk.CTkFrame(frame, fg_color="transparent")
@@ -259,9 +316,7 @@ class PreferencesDialog(ctk.CTkToplevel):
                       command=self._disconnect_google).pack(side="left")
 
     def _google_auth_status(self) -> str:
-        token_path = str(config_manager.get_config_dir() / "google_token.json")
-        import os
-        return ("✅  Connected to Google" if os.path.exists(token_path)
+        return ("✅  Connected to Google" if self._google_connected
                 else "⚠️  Not connected to Google")
 
     def _connect_google(self):
@@ -269,11 +324,11 @@ class PreferencesDialog(ctk.CTkToplevel):
         def _run():
             try:
                 from integrations.google_sheets import GoogleSheetsTracker
-                token_path = str(config_manager.get_config_dir() / "google_token.json")
-                creds_path = str(config_manager.get_config_dir() / "google_credentials.json")
-                tracker = GoogleSheetsTracker(token_path=token_path)
+                creds_path = str(self._token_path.with_name("google_credentials.json"))
+                tracker = GoogleSheetsTracker(token_path=str(self._token_path))
                 tracker.authenticate(creds_path)
-                self._google_status.configure(text="✅  Connected to Google")
+                self._google_connected = True
+                self._google_status.configure(text=self._google_auth_status())
             except FileNotFoundError:
                 self._google_status.configure(
                     text="⚠️  credentials.json not found.\n"
@@ -285,9 +340,9 @@ class PreferencesDialog(ctk.CTkToplevel):
     def _disconnect_google(self):
         try:
             from integrations.google_sheets import GoogleSheetsTracker
-            token_path = str(config_manager.get_config_dir() / "google_token.json")
-            GoogleSheetsTracker(token_path=token_path).revoke()
-            self._google_status.configure(text="⚠️  Not connected to Google")
+            GoogleSheetsTracker(token_path=str(self._token_path)).revoke()
+            self._google_connected = False
+            self._google_status.configure(text=self._google_auth_status())
         except Exception as e:
             self._google_status.configure(text=f"Error: {e}")
 
@@ -304,21 +359,21 @@ class PreferencesDialog(ctk.CTkToplevel):
 
         ctk.CTkSegmentedButton(
             frame, values=["Light", "Dark", "System"], variable=theme_var,
-            command=lambda v: ctk.set_appearance_mode(v.lower()),
+            command=self._preview_theme,
         ).grid(row=0, column=1, sticky="w", padx=(0,12), pady=16)
 
         ctk.CTkFrame(frame, height=1, fg_color=("gray80","gray30")).grid(
             row=1, column=0, columnspan=2, sticky="ew", padx=12)
 
         ctk.CTkLabel(frame, text="Reset",
-                     font=ctk.CTkFont(size=13, weight="bold"), anchor="w").grid(
+                     font=_font(13, "bold"), anchor="w").grid(
             row=2, column=0, sticky="w", padx=(12,8), pady=(16,4))
 
         ctk.CTkLabel(
             frame,
             text="Reset all settings to defaults and re-run the setup wizard.\n"
                  "Your tracked applications will not be deleted.",
-            font=ctk.CTkFont(size=12), text_color="gray", anchor="w", justify="left",
+            font=_font(12), text_color="gray", anchor="w", justify="left",
         ).grid(row=3, column=0, columnspan=2, sticky="w", padx=12)
 
         ctk.CTkButton(
@@ -330,9 +385,22 @@ class PreferencesDialog(ctk.CTkToplevel):
         # App version
         ctk.CTkLabel(
             frame, text=f"JobTrack v{APP_VERSION}",
-            font=ctk.CTkFont(size=11), text_color="gray",
+            font=_font(11), text_color="gray",
         ).grid(row=10, column=0, columnspan=2, sticky="sw", padx=12, pady=12)
 
+    def _preview_theme(self, value: str):
+        """Live-preview the theme, debounced so rapid clicks apply once."""
+        if self._theme_after_id is not None:
+            self.after_cancel(self._theme_after_id)
+        self._theme_after_id = self.after(150, self._apply_theme, value.lower())
+
+    def _apply_theme(self, theme: str):
+        # set_appearance_mode recolors every widget — skip when unchanged
+        self._theme_after_id = None
+        if theme != self._applied_theme:
+            self._applied_theme = theme
+            ctk.set_appearance_mode(theme)
+
     def _reset_to_defaults(self):
         """Confirm then wipe config and restart wizard."""
         dialog = ctk.CTkInputDialog(
@@ -351,50 +419,115 @@ class PreferencesDialog(ctk.CTkToplevel):
 
     # ── Save ──────────────────────────────────────────────────────────────────
 
+    @staticmethod
+    def _save_keys(dirty: list, results: queue.Queue):
+        """
+        Write changed keys to the keyring (worker thread). Each outcome is put
+        on results as (key_name, value, error); None marks the end.
+        """
+        for key_name, val in dirty:
+            try:
+                keyring_manager.save_key(key_name, val)
+                results.put((key_name, val, None))
+            except Exception as e:
+                results.put((key_name, val, e))
+        results.put(None)
+
+    def _poll_key_save(self):
+        """Drain keyring write results on the Tk thread until the writer is done."""
+        if not self.winfo_exists():
+            return
+        while True:
+            try:
+                item = self._key_results.get_nowait()
+            except queue.Empty:
+                self.after(50, self._poll_key_save)
+                return
+            if item is None:
+                break
+            key_name, val, err = item
+            if err is None:
+                self._key_originals[key_name] = val   # Only once it is really stored
+            else:
+                logger.error(f"Could not store '{key_name}' key in keyring: {err}")
+                self._key_failures.append(key_name)
+
+        self._key_results = None
+        if self._key_failures:
+            self._status.configure(
+                text=f"⚠️  Could not save key(s): {', '.join(self._key_failures)} — try Save again")
+        else:
+            self._finish_save()
+
+    def _finish_save(self):
+        self._status.configure(text="✅  Saved")
+        self.after(800, self.destroy)
+
     def _save(self):
         """Read all widget values back into config and persist."""
+        if self._key_results is not None:
+            return   # Previous keyring write still in flight
         # ── Location ──────────────────────────────────────────────────────────
         loc = self._config.setdefault("location", {})
         loc["city"]  = self._widgets["loc_city"].get().strip()
-        loc["state"] = normalize_state(self._widgets["loc_state"].get().strip())
+        loc["state"] = normalize_state(self._widgets["loc_state"].get())
         loc["zip"]   = self._widgets["loc_zip"].get().strip()
         self._config["search_radius_miles"] = self._widgets["radius_var"].get()
 
+        # Tabs that were never opened keep their config values unchanged
+        built = self._built_tabs
+
         # ── Job search ────────────────────────────────────────────────────────
-        prefs = self._config.setdefault("job_preferences", {})
-        raw_kw = self._widgets["keywords"].get()
-        prefs["keywords"] = [k.strip() for k in raw_kw.split(",") if k.strip()]
-        prefs["work_type"]        = self._widgets["work_type"].get().lower()
-        prefs["experience_level"] = self._widgets["experience_level"].get().lower()
+        if "Job Search" in built:
+            prefs = self._config.setdefault("job_preferences", {})
+            raw_kw = self._widgets["keywords"].get()
+            prefs["keywords"] = [k.strip() for k in raw_kw.split(",") if k.strip()]
+            prefs["work_type"]        = self._widgets["work_type"].get().lower()
+            prefs["experience_level"] = self._widgets["experience_level"].get().lower()
 
         # ── Providers (enabled flags) ─────────────────────────────────────────
-        prov_cfg = self._config.setdefault("providers", {})
-        for pid in ["indeed", "linkedin", "glassdoor", "adzuna"]:
-            prov_cfg.setdefault(pid, {})["enabled"] = \
-                self._widgets[f"enabled_{pid}"].get()
-
-        # ── API keys (keyring) ────────────────────────────────────────────────
-        key_fields = ["usajobs", "usajobs_email", "indeed", "linkedin",
-                      "glassdoor", "adzuna", "anthropic", "openrouteservice"]
-        for key_name in key_fields:
-            val = self._widgets[f"key_{key_name}"].get().strip()
-            if val:
-                keyring_manager.save_key(key_name, val)
+        if "Providers & Keys" in built:
+            prov_cfg = self._config.setdefault("providers", {})
+            for pid in _TOGGLEABLE_PROVIDERS:
+                prov_cfg.setdefault(pid, {})["enabled"] = self._enabled_vars[pid].get()
+
+            # ── API keys (keyring) ────────────────────────────────────────────
+            # Only write keys that changed, and off the UI thread — each
+            # keyring call is a round-trip to the OS credential store.
+            # Not a daemon thread, so exiting right after Save can't cut a write short.
+            dirty = []
+            for key_name, entry in self._key_entries.items():
+                val = entry.get().strip()
+                if val and val != self._key_originals.get(key_name):
+                    dirty.append((key_name, val))
+            if dirty:
+                self._key_results = queue.Queue()
+                self._key_failures = []
+                threading.Thread(target=self._save_keys,
+                                 args=(dirty, self._key_results)).start()
 
         # ── Tracker ───────────────────────────────────────────────────────────
-        self._config.setdefault("tracker", {})["mode"] = \
-            self._widgets["tracker_mode"].get()
+        if "Tracker" in built:
+            self._config.setdefault("tracker", {})["mode"] = \
+                self._widgets["tracker_mode"].get()
 
         # ── Appearance ────────────────────────────────────────────────────────
-        theme = self._widgets["theme"].get().lower()
-        self._config["theme"] = theme
-        ctk.set_appearance_mode(theme)
+        if "Appearance" in built:
+            theme = self._widgets["theme"].get().lower()
+            self._config["theme"] = theme
+            if self._theme_after_id is not None:
+                self.after_cancel(self._theme_after_id)
+            self._apply_theme(theme)
 
         # ── Persist ───────────────────────────────────────────────────────────
         config_manager.save(self._config)
-        self._status.configure(text="✅  Saved")
 
         if self._on_save:
             self._on_save(self._config)
 
-        self.after(800, self.destroy)
+        # Wait for the keyring writer before reporting success and closing
+        if self._key_results is not None:
+            self._status.configure(text="⟳  Saving API keys...")
+            self._poll_key_save()
+        else:
+            self._finish_save()
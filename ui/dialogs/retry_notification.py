@@ -7,12 +7,14 @@ Auto-dismisses after 3s or when explicitly closed.
 """
 
 import customtkinter as ctk
+from ui.components.fonts import font as _font
 
 
 class RetryNotification(ctk.CTkToplevel):
     """
     Non-blocking toast notification shown when a provider is being retried.
-    Positioned in the bottom-right of the screen.
+    Positioned in the bottom-right of the screen. Built once and reused:
+    show() refreshes the text and dismiss() only hides the window.
     """
 
     AUTO_DISMISS_MS = 3000
@@ -24,13 +26,11 @@ class RetryNotification(ctk.CTkToplevel):
         self.attributes("-topmost", True)
         self.attributes("-alpha", 0.92)
 
-        self._build(provider_name, attempt, max_attempts)
-        self._position()
-
-        # Auto-dismiss
-        self.after(self.AUTO_DISMISS_MS, self.dismiss)
+        self._dismiss_after_id = None
+        self._build()
+        self.show(provider_name, attempt, max_attempts)
 
-    def _build(self, provider: str, attempt: int, max_attempts: int):
+    def _build(self):
         self.configure(fg_color=("gray20", "gray15"))
 
         frame = ctk.CTkFrame(self, fg_color=("gray25", "gray18"),
@@ -38,18 +38,23 @@ class RetryNotification(ctk.CTkToplevel):
                              border_color=("gray60", "gray40"))
         frame.pack(padx=2, pady=2)
 
-        ctk.CTkLabel(
-            frame,
-            text=f"⟳  Retrying {provider}",
-            font=ctk.CTkFont(size=13, weight="bold"),
-        ).pack(padx=16, pady=(12, 2))
+        self._title_lbl = ctk.CTkLabel(frame, font=_font(13, "bold"))
+        self._title_lbl.pack(padx=16, pady=(12, 2))
 
-        ctk.CTkLabel(
-            frame,
-            text=f"Attempt {attempt} of {max_attempts}",
-            font=ctk.CTkFont(size=11),
-            text_color="gray",
-        ).pack(padx=16, pady=(0, 12))
+        self._sub_lbl = ctk.CTkLabel(frame, font=_font(11), text_color="gray")
+        self._sub_lbl.pack(padx=16, pady=(0, 12))
+
+    def show(self, provider: str, attempt: int, max_attempts: int):
+        """Display (or refresh) the toast and restart the auto-dismiss timer."""
+        self._title_lbl.configure(text=f"⟳  Retrying {provider}")
+        self._sub_lbl.configure(text=f"Attempt {attempt} of {max_attempts}")
+        self.deiconify()
+        self._position()
+
+        # Auto-dismiss
+        if self._dismiss_after_id is not None:
+            self.after_cancel(self._dismiss_after_id)
+        self._dismiss_after_id = self.after(self.AUTO_DISMISS_MS, self.dismiss)
 
     def _position(self):
         """Position in the bottom-right corner of the screen."""
@@ -63,19 +68,29 @@ class RetryNotification(ctk.CTkToplevel):
         self.geometry(f"+{x}+{y}")
 
     def dismiss(self):
-        """Close the notification (called automatically or by parent)."""
+        """Hide the notification (called automatically or by parent)."""
+        self._dismiss_after_id = None
         try:
-            self.destroy()
+            self.withdraw()
         except Exception:
             pass   # Already destroyed
 
 
+_TOAST = None   # The one RetryNotification, reused across retries
+
+
 def show_retry_toast(parent, provider_name: str, attempt: int,
                      max_attempts: int) -> RetryNotification:
     """
-    Convenience function — create and show a RetryNotification.
+    Convenience function — show the shared RetryNotification, creating it
+    on first use (or if it was destroyed along with its parent).
 
     Returns the notification widget so the caller can dismiss it early
     (e.g., when the retry succeeds).
     """
-    return RetryNotification(parent, provider_name, attempt, max_attempts)
+    global _TOAST
+    if _TOAST is not None and _TOAST.master is parent and _TOAST.winfo_exists():
+        _TOAST.show(provider_name, attempt, max_attempts)
+    else:
+        _TOAST = RetryNotification(parent, provider_name, attempt, max_attempts)
+    return _TOAST
@@ -20,9 +20,14 @@ Layout:
 """
 
 import customtkinter as ctk
+import logging
+import queue
+import threading
 import webbrowser
 from datetime import datetime
 
+logger = logging.getLogger("jobtrack.ui.main_window")
+
 
 class MainWindow(ctk.CTkFrame):
     """
@@ -48,6 +53,9 @@ class MainWindow(ctk.CTkFrame):
 
     SUPPORT_EMAIL = "pjgrenier@gmail.com"
 
+    # "Mark as Applied" clicks within this window are saved in one transaction
+    APPLIED_FLUSH_MS = 200
+
     def __init__(self, parent, config: dict, **kwargs):
         super().__init__(parent, fg_color="transparent", **kwargs)
         self.config = config
@@ -56,6 +64,9 @@ class MainWindow(ctk.CTkFrame):
         self._nav_buttons: dict = {}
         self._job_results: list = []
         self._last_search_time: str = "Never"
+        self._applied_queue: list = []   # (job_data, on_error) pairs
+        self._applied_flush_pending = False
+        self._about_dialog = None
 
         self._build_layout()
         self._build_sidebar()
@@ -257,6 +268,47 @@ class MainWindow(ctk.CTkFrame):
     def get_job_results(self) -> list:
         return self._job_results
 
+    def queue_application(self, job_data: dict, on_error=None) -> None:
+        """
+        Queue an application for saving. Called by JobCard, which shows its
+        confirmation immediately; on_error is called back if the save fails.
+        """
+        self._applied_queue.append((job_data, on_error))
+        if not self._applied_flush_pending:
+            self._applied_flush_pending = True
+            self.after(self.APPLIED_FLUSH_MS, self._flush_applied)
+
+    def _flush_applied(self) -> None:
+        """Write every queued application in a background thread."""
+        batch, self._applied_queue = self._applied_queue, []
+        self._applied_flush_pending = False
+        result = queue.Queue(maxsize=1)   # None on success, else the exception
+
+        def _save():
+            from db import jobs_repo
+            try:
+                jobs_repo.add_applications([job for job, _ in batch])
+                result.put(None)
+            except Exception as e:
+                result.put(e)
+
+        # Not a daemon: exiting right after a click must not drop the write
+        threading.Thread(target=_save).start()
+        self._poll_applied(result, batch)
+
+    def _poll_applied(self, result: queue.Queue, batch: list) -> None:
+        """Wait for the save on the Tk thread; roll back the cards if it failed."""
+        try:
+            err = result.get_nowait()
+        except queue.Empty:
+            self.after(50, self._poll_applied, result, batch)
+            return
+        if err is not None:
+            logger.error(f"Error saving applications: {err}")
+            for _, on_error in batch:
+                if on_error:
+                    on_error()
+
     def show_progress(self, message: str = "Searching...") -> None:
         self._progress_bar.start(message)
 
@@ -270,8 +322,12 @@ class MainWindow(ctk.CTkFrame):
         PreferencesDialog(self, config=self.config, on_save=self._on_preferences_saved)
 
     def _open_about(self) -> None:
+        # Built once, then hidden/shown — see AboutDialog.close()
+        if self._about_dialog is not None and self._about_dialog.winfo_exists():
+            self._about_dialog.show(self)
+            return
         from ui.dialogs.about_dialog import AboutDialog
-        AboutDialog(self)
+        self._about_dialog = AboutDialog(self)
 
     def _report_issue(self) -> None:
         """Open the user's default mail client with a pre-filled bug report email."""
@@ -6,6 +6,7 @@ Job Results panel — scrollable list of JobListing cards with filter bar.
 
 import customtkinter as ctk
 from core.job_model import JobListing
+from ui.components.fonts import font as _font
 
 
 class JobsPanel(ctk.CTkFrame):
@@ -16,6 +17,8 @@ class JobsPanel(ctk.CTkFrame):
         self.config = config
         self.main_window = main_window
         self._all_results: list[JobListing] = []
+        self._cards: list = []   # JobCard pool, recycled across renders
+        self._message: ctk.CTkLabel = None
         self._build()
 
     def _build(self):
@@ -28,7 +31,7 @@ class JobsPanel(ctk.CTkFrame):
         filter_bar.grid_propagate(False)
 
         ctk.CTkLabel(filter_bar, text="Filter:",
-                     font=ctk.CTkFont(size=13)).pack(side="left", padx=(16, 4), pady=14)
+                     font=_font(13)).pack(side="left", padx=(16, 4), pady=14)
 
         self._work_filter = ctk.CTkSegmentedButton(
             filter_bar,
@@ -48,7 +51,7 @@ class JobsPanel(ctk.CTkFrame):
 
         self._result_count = ctk.CTkLabel(
             filter_bar, text="0 jobs found",
-            font=ctk.CTkFont(size=12), text_color="gray")
+            font=_font(12), text_color="gray")
         self._result_count.pack(side="right", padx=16)
 
         # ── Job card list ─────────────────────────────────────────────────────
@@ -59,14 +62,22 @@ class JobsPanel(ctk.CTkFrame):
         self._show_empty_state()
 
     def _show_empty_state(self):
-        for w in self._job_list.winfo_children():
-            w.destroy()
-        ctk.CTkLabel(
-            self._job_list,
-            text="No results yet.\nGo to the Dashboard and click 'Search for Jobs Now' to get started.",
-            font=ctk.CTkFont(size=14), text_color="gray",
-            justify="center",
-        ).grid(row=0, column=0, pady=80)
+        self._show_message(
+            "No results yet.\nGo to the Dashboard and click 'Search for Jobs Now' to get started.",
+            pady=80,
+        )
+
+    def _show_message(self, text: str, pady: int):
+        """Hide every card and show a single centered message in the list."""
+        for card in self._cards:
+            card.grid_remove()
+        if self._message is None:
+            self._message = ctk.CTkLabel(
+                self._job_list, font=_font(14),
+                text_color="gray", justify="center",
+            )
+        self._message.configure(text=text)
+        self._message.grid(row=0, column=0, pady=pady)
 
     def on_results_updated(self, results: list):
         """Called by main_window when a new search completes."""
@@ -94,18 +105,22 @@ class JobsPanel(ctk.CTkFrame):
         self._result_count.configure(text=f"{len(filtered)} jobs found")
 
     def _render_results(self, jobs: list):
-        for w in self._job_list.winfo_children():
-            w.destroy()
-
         if not jobs:
-            ctk.CTkLabel(
-                self._job_list,
-                text="No jobs match the current filters.",
-                font=ctk.CTkFont(size=14), text_color="gray",
-            ).grid(row=0, column=0, pady=40)
+            self._show_message("No jobs match the current filters.", pady=40)
             return
+        if self._message is not None:
+            self._message.grid_remove()
 
+        # Rebind existing cards before creating new ones; Tk widget creation
+        # is the slow part of re-rendering a long result list.
         from ui.components.job_card import JobCard
         for i, job in enumerate(jobs):
-            card = JobCard(self._job_list, job=job, main_window=self.main_window)
+            if i < len(self._cards):
+                card = self._cards[i]
+                card.bind_job(job)
+            else:
+                card = JobCard(self._job_list, job=job, main_window=self.main_window)
+                self._cards.append(card)
             card.grid(row=i, column=0, sticky="ew", pady=4, padx=4)
+        for card in self._cards[len(jobs):]:
+            card.grid_remove()